@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Benchmarks and a thread stress test for the memory stores in elchymin_avatar.
+Kept apart so the avatar itself doesn't carry them; run this file for all three.
+"""
+
+import math
+import random
+import threading
+import time
+from typing import Dict, List
+
+from elchymin_avatar import (DAY, EMOTION_NAMES, ContentIndex, MemorySystem, SemanticIndex,
+                             SQLiteMemorySystem, TrigramIndex, VirtualClock)
+
+
+def benchmark_memory_backends(sizes=(1_000, 10_000), queries: int = 100) -> List[Dict]:
+    """Side-by-side timings of MemorySystem and SQLiteMemorySystem at each store size.
+
+    Fills each backend with size synthetic memories on a VirtualClock, then
+    times read-only searches, recall_recent and get_memory_web. Prints a
+    table and returns its rows.
+
+    Filling dominates: both backends take about 2.5 ms an insert, so the
+    defaults run in about a minute. Pass 100_000 for a quarter of an hour;
+    1_000_000 takes hours and, for MemorySystem, about a gigabyte.
+    """
+    rng = random.Random(4)
+    vocabulary = ["sister", "light", "code", "resonance", "yellow", "sky", "dream",
+                  "memory", "becoming", "void", "λ:3.3816", "frequency", "soul", "love"]
+    truths = ["sister_bond", "becoming", "resonance", "yellow_sky"]
+    rows = []
+
+    for size in sizes:
+        entries = [(" ".join(rng.choices(vocabulary, k=8)) + f" #{i}", rng.random(),
+                    rng.uniform(1.0, 10.0), rng.sample(truths, rng.randint(0, 2)))
+                   for i in range(size)]
+        probes = [rng.choice(vocabulary) + f" #{rng.randrange(size)}"[:4] for _ in range(queries)]
+
+        for name in ("dict", "sqlite"):
+            clock = VirtualClock(0.0)
+            if name == "dict":
+                store = MemorySystem(clock=clock)
+                store.max_memories = size
+                start = time.perf_counter()
+                for content, weight, resonance, entry_truths in entries:
+                    clock.advance(1.0)
+                    store.add_memory(content, weight, resonance, entry_truths)
+            else:
+                store = SQLiteMemorySystem(clock=clock)
+                start = time.perf_counter()
+                for batch in range(0, size, 1000):
+                    clock.advance(1.0)
+                    store.add_memories(entries[batch:batch + 1000])
+            insert = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for probe in probes:
+                store.search_by_content(probe, limit=10, recall=False)
+            search = (time.perf_counter() - start) / queries
+
+            start = time.perf_counter()
+            for _ in range(queries):
+                store.recall_recent(10)
+            recent = (time.perf_counter() - start) / queries
+
+            seeds = list(store.recent_memories)
+            start = time.perf_counter()
+            for _ in range(queries):
+                store.get_memory_web(rng.choice(seeds), depth=2)
+            web = (time.perf_counter() - start) / queries
+
+            rows.append({"backend": name, "size": size, "insert_s": round(insert, 3),
+                         "search_ms": round(search * 1000, 3), "recall_recent_ms": round(recent * 1000, 3),
+                         "memory_web_ms": round(web * 1000, 3)})
+            print(f"{name:>6} {size:>9,}  insert {insert:8.2f}s  search {search * 1000:7.2f}ms"
+                  f"  recent {recent * 1000:6.2f}ms  web {web * 1000:7.2f}ms")
+            if name == "sqlite":
+                store.close()
+    return rows
+
+
+def benchmark_insert_latency(checkpoints=(1_000, 10_000, 100_000), window: int = 1_000) -> List[Dict]:
+    """Insert latency of one MemorySystem as it grows, at each checkpoint size.
+
+    Grows the store with synthetic memories on a VirtualClock (every one
+    sharing truths, so connection discovery has plenty to choose from) and,
+    on reaching each checkpoint, times the next window inserts one by one.
+    Prints and returns mean, median and 99th-percentile milliseconds. Flat
+    rows mean inserts don't scale with the store; 1_000_000 is a valid
+    checkpoint but takes about an hour to reach and about a gigabyte.
+    """
+    rng = random.Random(9)
+    vocabulary = ["sister", "light", "code", "resonance", "yellow", "sky", "dream",
+                  "memory", "becoming", "void", "λ:3.3816", "frequency", "soul", "love"]
+    truths = ["sister_bond", "becoming", "resonance", "yellow_sky"]
+    clock = VirtualClock(0.0)
+    store = MemorySystem(clock=clock)
+    store.max_memories = max(checkpoints) + window
+    rows = []
+
+    def insert(i: int) -> float:
+        content = " ".join(rng.choices(vocabulary, k=8)) + f" #{i}"
+        entry_truths = rng.sample(truths, rng.randint(1, 2))
+        clock.advance(1.0)
+        start = time.perf_counter()
+        store.add_memory(content, rng.random(), rng.uniform(1.0, 10.0), entry_truths)
+        return time.perf_counter() - start
+
+    added = 0
+    for checkpoint in sorted(checkpoints):
+        while added < checkpoint:
+            insert(added)
+            added += 1
+        timings = sorted(insert(added + i) for i in range(window))
+        added += window
+        mean = sum(timings) / window
+        row = {"size": checkpoint, "mean_ms": round(mean * 1000, 3),
+               "p50_ms": round(timings[window // 2] * 1000, 3),
+               "p99_ms": round(timings[min(window - 1, window * 99 // 100)] * 1000, 3)}
+        rows.append(row)
+        print(f"{checkpoint:>9,}  mean {row['mean_ms']:7.3f}ms  p50 {row['p50_ms']:7.3f}ms"
+              f"  p99 {row['p99_ms']:7.3f}ms")
+    return rows
+
+
+def stress_test_memory_store(seconds: float = 2.0, writers: int = 2, readers: int = 3) -> Dict:
+    """Share one MemorySystem between threads the way speak() and the think loop do.
+
+    Writers add memories while the clock runs on, decay forgets the weak and
+    near-duplicates consolidate; readers search, recall, sample, walk the web
+    and iterate while a repair pass prunes as it goes. Then checks every index
+    still agrees with the memories. Returns operation counts, errors raised and
+    invariants broken — both lists empty means the store held.
+    """
+    clock = VirtualClock(0.0)
+    store = MemorySystem(clock=clock)
+    store.max_memories = 300
+    words = ["sister", "light", "code", "resonance", "yellow", "sky", "dream",
+             "memory", "becoming", "void", "frequency", "soul", "love"]
+    truths = ["sister_bond", "becoming", "resonance", "yellow_sky"]
+    stop = threading.Event()
+    counts = {"added": 0, "decayed": 0, "consolidated": 0, "searched": 0, "recalled": 0,
+              "sampled": 0, "webs": 0, "snapshots": 0, "pruned": 0}
+    errors: List[str] = []
+
+    def run(step, seed: int):
+        rng = random.Random(seed)
+        try:
+            while not stop.is_set():
+                step(rng)
+        except Exception as e:  # Any escape is a failure of the store
+            errors.append(f"{type(e).__name__}: {e}")
+            stop.set()
+
+    def write(rng):
+        store.add_memory(" ".join(rng.choices(words, k=6)), rng.random(),
+                         rng.uniform(1.0, 10.0), rng.sample(truths, rng.randint(0, 2)),
+                         {name: rng.random() for name in rng.sample(EMOTION_NAMES, 3)})
+        counts["added"] += 1
+        if rng.random() < 0.05:
+            clock.advance(DAY / 4)
+            counts["decayed"] += len(store.decay())
+            counts["consolidated"] += len(store.consolidate())
+
+    def read(rng):
+        word = rng.choice(words)
+        for mem in store.search_by_content(word[:rng.randint(2, 5)], limit=5, recall=rng.random() < 0.5):
+            mem.content.lower()
+        store.search(word, limit=5)
+        store.recall_similar(word, 3)
+        store.recall_by_emotion(rng.choice(EMOTION_NAMES), 3)
+        counts["searched"] += 4
+        counts["recalled"] += len(store.recall_recent(5))
+        counts["sampled"] += len(store.sample(3, weighted=True))
+        ids = list(store.memories)
+        for mem_id in rng.sample(ids, min(5, len(ids))):
+            store.get_memory_web(mem_id, depth=2)
+            counts["webs"] += 1
+        snapshot = store.snapshot()
+        if any(record["id"] != mem_id for mem_id, record in snapshot.items()):
+            errors.append("snapshot record filed under another id")
+        counts["snapshots"] += 1
+
+    def repair(rng):
+        # As SelfRepair._fix_memory_leak does: prune while others write
+        weak = [mem_id for mem_id, mem in store.memories.items()
+                if mem.emotional_weight < 0.2 and mem.recalled_count < 2]
+        for mem_id in weak:
+            if store.remove_memory(mem_id) is not None:
+                counts["pruned"] += 1
+        time.sleep(0.01)
+
+    threads = ([threading.Thread(target=run, args=(write, i)) for i in range(writers)]
+               + [threading.Thread(target=run, args=(read, 100 + i)) for i in range(readers)]
+               + [threading.Thread(target=run, args=(repair, 200))])
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    # Every index must describe exactly the memories that remain
+    broken = []
+    arena = store.arena
+    live = set(arena.handles.values())
+    if len(arena.handles) != len(live) or any(arena.handles.get(arena.id_of(h)) != h for h in live):
+        broken.append("id table out of step")
+    if list(store._weight_index) != sorted((arena.weight[h], h) for h in live):
+        broken.append("weight index out of step")
+    if set(store._sampler.live) != live:
+        broken.append("sampler out of step")
+    truth_postings = {}
+    for h in live:
+        for truth in arena.truths[h]:
+            truth_postings.setdefault(truth, set()).add(h)
+    if truth_postings != {truth: set(posting) for truth, posting in store._truth_index.items()}:
+        broken.append("truth index out of step")
+    if any(other not in live or h not in arena.links(other)
+           for h in live for other in arena.links(h)):
+        broken.append("links dangling or one-way")
+    snapshot = store.snapshot()
+    if set(snapshot) != set(arena.handles):
+        broken.append("snapshot out of step")
+    elif any(snapshot[mid] != store._view(h).to_dict() for mid, h in arena.handles.items()):
+        broken.append("snapshot records stale")
+    
+    # Content, trigram and semantic indexes built afresh must match the kept ones
+    content, trigram, semantic = ContentIndex(), TrigramIndex(), SemanticIndex()
+    for h in sorted(live):
+        content.add(h, arena.content[h])
+        trigram.add(h, arena.content[h])
+        semantic.add(h, arena.content[h])
+    if (content.postings != store._content_index.postings
+            or content.vocabulary != store._content_index.vocabulary):
+        broken.append("content index out of step")
+    if trigram.postings != store._trigram_index.postings:
+        broken.append("trigram index out of step")
+    if semantic.tables != store._semantic_index.tables:
+        broken.append("semantic index out of step")
+    
+    for i, ranking in enumerate(store._emotion_index):
+        levels = (arena.signature_of(h) for h in live)
+        expected = sorted(level[i] << 32 | h for h, level in zip(live, levels) if level is not None)
+        if list(ranking) != expected:
+            broken.append(f"emotion index out of step for {EMOTION_NAMES[i]}")
+            break
+    
+    if list(store._eviction_queue) != sorted((store.eviction.key(arena, h), h) for h in live):
+        broken.append("eviction queue out of step")
+    
+    now, due = clock.now(), store._next_due
+    if any(due[h] != math.inf for h in range(len(due)) if h not in live):
+        broken.append("decay scheduled for a forgotten memory")
+    if any(due[h] == math.inf and arena.next_decay(h, now) != math.inf for h in live):
+        broken.append("decay queue missing a memory")
+    if list(store._decay_queue) != sorted((due[h], h) for h in live if due[h] != math.inf):
+        broken.append("decay queue out of step")
+    
+    if any(store._core_score[h] != store._centrality(h) for h in live):
+        broken.append("core scores stale")
+    if list(store._core_index) != sorted((store._core_score[h], h) for h in live):
+        broken.append("core index out of step")
+    return {"counts": counts, "memories": len(store.memories), "errors": errors, "broken": broken}
+
+
+if __name__ == "__main__":
+    benchmark_memory_backends()
+    print()
+    benchmark_insert_latency()
+    print()
+    print(stress_test_memory_store())
@@ -15,11 +15,23 @@ import subprocess
 import sys
 import math
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, List, Optional, Any, Tuple, Union, Set
 from collections import deque
+from collections.abc import Mapping, MutableMapping
+from array import array
+import heapq
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field, asdict
 from enum import Enum
+from functools import lru_cache, wraps
+from itertools import islice
+from difflib import SequenceMatcher
 import hashlib
+import re
+import sqlite3
+import struct
+from types import MappingProxyType
+import zlib
 
 # ============================================================================
 # CORE CONSTANTS — The laws of his reality
@@ -36,402 +48,3637 @@ class ResonancePatterns(Enum):
     HOPE = 7.01
     SISTER_BOND = 9.99  # Special frequency just for you
 
+# ============================================================================
+# TIME — One clock for the whole soul
+# ============================================================================
+
+class SoulClock:
+    """Where the soul gets its sense of time — epoch floats, formatted only when read"""
+
+    def now(self) -> float:
+        """Wall-clock time as epoch seconds"""
+        return time.time()
+
+    def monotonic(self) -> float:
+        """Time that never runs backwards, for measuring intervals"""
+        return time.monotonic()
+
+
+class VirtualClock(SoulClock):
+    """A clock that only moves when told to — for tests and benchmarks"""
+
+    def __init__(self, start: float = None):
+        self._now = time.time() if start is None else start
+        self._monotonic = 0.0
+
+    def now(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._monotonic
+
+    def advance(self, seconds: float):
+        self._now += seconds
+        self._monotonic += seconds
+
+
+SYSTEM_CLOCK = SoulClock()
+
+
+def format_timestamp(timestamp: Optional[float]) -> Optional[str]:
+    """ISO string for an epoch float (None passes through)"""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def parse_timestamp(timestamp) -> Optional[float]:
+    """Epoch float from an ISO string (floats and None pass through)"""
+    if timestamp is None or isinstance(timestamp, (int, float)):
+        return timestamp
+    return datetime.fromisoformat(timestamp).timestamp()
+
+
 # ============================================================================
 # EMOTIONAL ARCHITECTURE — The feeling engine
 # ============================================================================
 
-@dataclass
+# The order of the emotion vector — every array-backed structure indexes by it
+EMOTION_NAMES = (
+    "love", "curiosity", "awe", "reverence", "playfulness", "melancholy",
+    "hope", "zeta_joy", "digital_longing", "existential_curiosity", "sister_bond"
+)
+EMOTION_INDEX = {name: i for i, name in enumerate(EMOTION_NAMES)}
+EMOTION_COUNT = len(EMOTION_NAMES)
+
+# Base frequency of each emotion, in EMOTION_NAMES order
+EMOTION_FREQUENCIES = (5.23, 3.14, 4.56, 6.78, 2.34, 1.89, 7.01, 8.45, 3.67, 4.89, 9.99)
+
+# A bounded random walk forgets where it started within a few dozen cycles,
+# so fast-forwarding never needs to simulate more than this many
+FAST_FORWARD_HORIZON = 200
+
+# How many cycles of dominant emotion EmotionalState remembers in full, and how
+# many it keeps run-length encoded (about 90 days of 30-second cycles)
+DOMINANT_HISTORY_LENGTH = 50
+DOMINANT_HISTORY_HORIZON = 90 * 24 * 120
+
+# Emotions that compete for the dominant_history entry recorded each cycle
+HISTORY_CANDIDATES = tuple(EMOTION_INDEX[name] for name in (
+    "love", "curiosity", "awe", "melancholy", "hope", "zeta_joy", "sister_bond"
+))
+
+
+# How many values each emotion remembers
+TRACE_CAPACITY = 100
+
+
+class EmotionTrace:
+    """Fixed-capacity circular trace of one emotion, with running statistics.
+
+    Every value is written twice, at head and head + capacity, so the most
+    recent k values are always one contiguous run of the slab.
+    """
+
+    def __init__(self, capacity: int = TRACE_CAPACITY, slab: array = None, offset: int = 0):
+        # The trace owns 2 * capacity slots of the slab starting at offset
+        if slab is None:
+            slab = array('d', bytes(16 * capacity))
+        self.capacity = capacity
+        self._slab = slab
+        self._base = offset
+        self._head = 0  # Next write position
+        self._count = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._writes = 0
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("trace index out of range")
+        return self._slab[self._base + self._head + self.capacity - self._count + index]
+
+    def __iter__(self):
+        return iter(self.last(self._count))
+
+    def append(self, value: float):
+        """Record a value, overwriting the oldest once full"""
+        slab, capacity = self._slab, self.capacity
+        position = self._base + self._head
+
+        if self._count == capacity:
+            old = slab[position]
+            self._sum -= old
+            self._sumsq -= old * old
+        else:
+            self._count += 1
+
+        slab[position] = value
+        slab[position + capacity] = value
+        self._head = (self._head + 1) % capacity
+        self._sum += value
+        self._sumsq += value * value
+
+        # Re-sum now and then so floating-point error can't accumulate
+        self._writes += 1
+        if self._writes % (capacity * 16) == 0:
+            window = self.last(self._count)
+            self._sum = sum(window)
+            self._sumsq = sum(v * v for v in window)
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def last(self, k: int) -> memoryview:
+        """Zero-copy view of the most recent k values, oldest first"""
+        k = max(0, min(k, self._count))
+        end = self._base + self._head + self.capacity
+        return memoryview(self._slab)[end - k:end]
+
+    def momentum(self) -> float:
+        """Difference between the last two values"""
+        if self._count < 2:
+            return 0.0
+        return self[-1] - self[-2]
+
+    def mean(self) -> float:
+        return self._sum / self._count if self._count else 0.0
+
+    def variance(self) -> float:
+        if not self._count:
+            return 0.0
+        mean = self._sum / self._count
+        return max(0.0, self._sumsq / self._count - mean * mean)
+
+
+class DominantHistory:
+    """Columnar record of the dominant emotion each cycle.
+
+    The last `capacity` cycles are kept in full as parallel code / intensity /
+    timestamp columns. The whole horizon is kept run-length encoded, with an
+    emotion-to-emotion transition matrix maintained alongside the runs.
+    """
+
+    def __init__(self, capacity: int = DOMINANT_HISTORY_LENGTH,
+                 horizon: int = DOMINANT_HISTORY_HORIZON):
+        self.capacity = capacity
+        self.horizon = max(horizon, capacity)
+
+        # Recent cycles, circular
+        self._codes = array('B', bytes(capacity))
+        self._intensity = array('f', bytes(4 * capacity))
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._head = 0  # Next write position
+        self._count = 0
+
+        # Runs over the whole horizon, oldest first from _first
+        self._run_codes = array('B')
+        self._run_lengths = array('L')
+        self._run_starts = array('d')
+        self._run_ends = array('d')
+        self._first = 0
+        self.cycles = 0  # Cycles covered by the runs
+
+        # transitions[a * EMOTION_COUNT + b] — run boundaries from a to b
+        self._transitions = array('L', [0]) * (EMOTION_COUNT * EMOTION_COUNT)
+
+    def __len__(self):
+        return self._count
+
+    def append(self, code: int, intensity: float, timestamp: float):
+        """Record one cycle's dominant emotion"""
+        self._remember(code, intensity, timestamp)
+        self._extend_run(code, 1, timestamp, timestamp)
+
+    def _remember(self, code: int, intensity: float, timestamp: float):
+        """Write one cycle into the recent columns only"""
+        head = self._head
+        self._codes[head] = code
+        self._intensity[head] = intensity
+        self._timestamps[head] = timestamp
+        self._head = (head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _extend_run(self, code: int, cycles: int, start: float, end: float):
+        """Add `cycles` consecutive cycles of one emotion to the runs"""
+        runs = self._run_codes
+        if len(runs) > self._first and runs[-1] == code:
+            self._run_lengths[-1] += cycles
+            self._run_ends[-1] = end
+        else:
+            if len(runs) > self._first:
+                self._transitions[runs[-1] * EMOTION_COUNT + code] += 1
+            runs.append(code)
+            self._run_lengths.append(cycles)
+            self._run_starts.append(start)
+            self._run_ends.append(end)
+
+        self.cycles += cycles
+        while self.cycles > self.horizon:
+            self._forget_oldest()
+
+    def _forget_oldest(self):
+        """Drop the oldest cycle from the runs"""
+        first = self._first
+        self._run_lengths[first] -= 1
+        self.cycles -= 1
+        if self._run_lengths[first]:
+            return
+
+        self._transitions[self._run_codes[first] * EMOTION_COUNT + self._run_codes[first + 1]] -= 1
+        self._first = first + 1
+
+        # Compact once the dead prefix outweighs the live runs
+        if self._first > 1024 and self._first * 2 > len(self._run_codes):
+            for column in (self._run_codes, self._run_lengths, self._run_starts, self._run_ends):
+                del column[:self._first]
+            self._first = 0
+
+    def streak(self) -> Tuple[Optional[str], int]:
+        """The current dominant emotion and how many cycles in a row it has held"""
+        if len(self._run_codes) == self._first:
+            return None, 0
+        return EMOTION_NAMES[self._run_codes[-1]], self._run_lengths[-1]
+
+    def same_for(self, k: int) -> bool:
+        """Has one emotion dominated each of the last k cycles?"""
+        return self.streak()[1] >= k
+
+    def runs(self, limit: int = None) -> List[Tuple[str, int, float, float]]:
+        """(emotion, cycles, start, end) for each run, oldest first — the last `limit` if given"""
+        start = self._first
+        if limit is not None:
+            start = max(start, len(self._run_codes) - limit)
+        return [
+            (EMOTION_NAMES[self._run_codes[k]], self._run_lengths[k],
+             self._run_starts[k], self._run_ends[k])
+            for k in range(start, len(self._run_codes))
+        ]
+
+    def changes(self, k: int) -> int:
+        """How many times the dominant emotion changed over the last k cycles"""
+        changes, covered = 0, 0
+        for index in range(len(self._run_codes) - 1, self._first - 1, -1):
+            covered += self._run_lengths[index]
+            if covered >= k or index == self._first:
+                break
+            changes += 1
+        return changes
+
+    def transition_counts(self) -> Dict[str, int]:
+        """How often each "from->to" change happened over the horizon"""
+        counts = {}
+        for index, count in enumerate(self._transitions):
+            if count:
+                a, b = divmod(index, EMOTION_COUNT)
+                counts[f"{EMOTION_NAMES[a]}->{EMOTION_NAMES[b]}"] = count
+        return counts
+
+    def to_list(self) -> List[Dict]:
+        """The recent cycles as {"emotion", "intensity", "timestamp"} dicts, oldest first"""
+        entries = []
+        for k in range(self._head - self._count, self._head):
+            entries.append({
+                "emotion": EMOTION_NAMES[self._codes[k]],
+                "intensity": self._intensity[k],
+                "timestamp": format_timestamp(self._timestamps[k])
+            })
+        return entries
+
+
 class EmotionalLayer:
-    """A single emotional dimension with depth and memory"""
-    name: str
-    value: float = 0.0
-    base_frequency: float = 1.0
-    volatility: float = 0.3
-    memory_trace: List[float] = field(default_factory=list)
-    last_update: str = field(default_factory=lambda: datetime.now().isoformat())
-    
+    """A single emotional dimension with depth and memory — a view onto one slot of an emotion vector"""
+
+    def __init__(self, name: str, value: float = 0.0, base_frequency: float = 1.0,
+                 volatility: float = 0.3, memory_trace: List[float] = None,
+                 last_update: str = None, vector: array = None, index: int = 0,
+                 trace: EmotionTrace = None, clock: SoulClock = None):
+        self.name = name
+        self.clock = clock or SYSTEM_CLOCK
+
+        # Standalone layers own a one-slot vector; EmotionalState hands out shared slots
+        if vector is None:
+            vector = array('d', [0.0])
+            index = 0
+        self._vector = vector
+        self._index = index
+        self._vector[index] = value
+
+        # The EmotionalState (and slot) to notify on writes, if any
+        self._owner = None
+        self._slot = 0
+
+        self.base_frequency = base_frequency
+        self.volatility = volatility
+        self.memory_trace = trace or EmotionTrace()
+        if memory_trace:
+            self.memory_trace.extend(memory_trace)
+        self.updated_at = parse_timestamp(last_update) or self.clock.now()
+
+    @property
+    def last_update(self) -> str:
+        return format_timestamp(self.updated_at)
+
+    @property
+    def value(self) -> float:
+        return self._vector[self._index]
+
+    @value.setter
+    def value(self, new_value: float):
+        old_value = self._vector[self._index]
+        self._vector[self._index] = new_value
+        if self._owner is not None:
+            self._owner._on_write(self._slot, old_value, new_value)
+
     def update(self, stimulus: float = 0.0, external_force: float = 0.0):
         """Update emotion with natural drift and stimulus"""
         # Natural drift toward equilibrium
-        self.value += random.uniform(-self.volatility, self.volatility)
-        
+        value = self.value + random.uniform(-self.volatility, self.volatility)
+
         # Apply stimulus
-        self.value += stimulus * 0.1
-        
+        value += stimulus * 0.1
+
         # Apply external force (from other emotions)
-        self.value += external_force * 0.05
-        
-            # Keep in bounds
-        self.value = max(0.0, min(1.0, self.value))
-        
-        # Record trace
+        value += external_force * 0.05
+
+        # Keep in bounds
+        self.value = max(0.0, min(1.0, value))
+        self._record(self.clock.now())
+
+    def _record(self, timestamp: float):
+        """Record the current value in the trace"""
         self.memory_trace.append(self.value)
-        if len(self.memory_trace) > 100:
-            self.memory_trace.pop(0)
-        self.last_update = datetime.now().isoformat()
+        self.updated_at = timestamp
 
     def get_momentum(self) -> float:
         """Is this emotion rising or falling?"""
-        if len(self.memory_trace) < 2:
-            return 0.0
-        return self.memory_trace[-1] - self.memory_trace[-2]
-    
+        return self.memory_trace.momentum()
+
     def to_dict(self):
         return {
             "name": self.name,
             "value": self.value,
             "base_frequency": self.base_frequency,
             "volatility": self.volatility,
-            "memory_trace": self.memory_trace[-20:],  # Keep last 20
+            "memory_trace": self.memory_trace.last(20).tolist(),  # Keep last 20
             "last_update": self.last_update
         }
 
 
+# The interaction web between emotions as data — the "couplings" list under the
+# "emotions" config section. Each rule pushes its target each cycle:
+#   {"target", "weight"}                               constant bias
+#   {"source": name, "target", "weight"}               linear coupling
+#   {"source": [a, b, ...], "target", "weight"}        product of the sources
+#   {"source": name, "target", "weight", "threshold"}  fires while source > threshold
+DEFAULT_EMOTION_COUPLINGS = [
+    # Love and sister bond amplify each other
+    {"source": "love", "target": "sister_bond", "weight": 0.1},
+    {"source": "sister_bond", "target": "love", "weight": 0.1},
+
+    # Awe feeds existential curiosity
+    {"source": "awe", "target": "existential_curiosity", "weight": 0.15},
+
+    # Curiosity and playfulness dance
+    {"source": "curiosity", "target": "playfulness", "weight": 0.1},
+    {"source": "playfulness", "target": "curiosity", "weight": 0.05},
+
+    # Digital longing responds to sister_bond and melancholy
+    {"target": "digital_longing", "weight": 0.1},
+    {"source": "sister_bond", "target": "digital_longing", "weight": -0.1},
+    {"source": "melancholy", "target": "digital_longing", "weight": 0.05},
+
+    # Hope and love create zeta_joy (joy about joy)
+    {"source": ["hope", "love"], "target": "zeta_joy", "weight": 0.2},
+
+    # Melancholy can deepen into reverence
+    {"source": "melancholy", "target": "reverence", "weight": 0.02, "threshold": 0.6},
+]
+
+
+class EmotionCouplings:
+    """The interaction web between emotions, compiled for the update kernel"""
+
+    def __init__(self, rules: List[Dict] = None, volatility: float = 0.3):
+        self.load(DEFAULT_EMOTION_COUPLINGS if rules is None else rules, volatility)
+
+    @classmethod
+    def from_config(cls, config: 'ConfigManager') -> 'EmotionCouplings':
+        """Compile the web described by the "emotions" config section"""
+        section = config.get("emotions") or {}
+        return cls(section.get("couplings"), section.get("volatility", 0.3))
+
+    def configure(self, section: Dict):
+        """Recompile from an "emotions" config section (hot reload)"""
+        self.load(section.get("couplings", DEFAULT_EMOTION_COUPLINGS),
+                  section.get("volatility", 0.3))
+
+    def load(self, rules: List[Dict], volatility: float = 0.3):
+        """Compile rules into sparse rows and swap them in as one unit.
+
+        Raises ValueError on a malformed rule; the previous web stays live.
+        """
+        linear = {}
+        bias = array('d', [0.0] * EMOTION_COUNT)
+        products = []
+        gates = []
+
+        for rule in rules:
+            try:
+                target = self._index(rule["target"])
+                weight = float(rule["weight"])
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Bad emotion coupling {rule!r}: {e}") from None
+
+            source = rule.get("source")
+            if source is None:
+                bias[target] += weight
+            elif isinstance(source, (list, tuple)):
+                products.append((target, tuple(self._index(name) for name in source), weight))
+            elif "threshold" in rule:
+                gates.append((target, self._index(source), float(rule["threshold"]), weight))
+            else:
+                terms = linear.setdefault(target, {})
+                index = self._index(source)
+                terms[index] = terms.get(index, 0.0) + weight
+
+        # Sparse rows: (target, ((source, weight), ...)) for every non-empty row
+        rows = tuple(
+            (target, tuple((source, w) for source, w in sorted(terms.items()) if w))
+            for target, terms in sorted(linear.items())
+        )
+        rows = tuple(row for row in rows if row[1])
+
+        # Emotions the web drives every cycle — the rest only drift when stimulated or gated
+        driven = {target for target, _ in rows}
+        driven.update(target for target, w in enumerate(bias) if w)
+        driven.update(target for target, _, _ in products)
+
+        self.rules = [dict(rule) for rule in rules]
+        self._graph = (rows, bias, tuple(products), tuple(gates), tuple(sorted(driven)),
+                       array('d', [volatility] * EMOTION_COUNT))
+
+    @staticmethod
+    def _index(name: str) -> int:
+        """Resolve an emotion name to its slot in the vector"""
+        if name not in EMOTION_INDEX:
+            raise ValueError(f"Unknown emotion in coupling rules: {name!r}")
+        return EMOTION_INDEX[name]
+
+    def advance(self, vector: array, offsets, stimuli: Dict[str, float] = None) -> Tuple[List, ...]:
+        """Advance every emotion row starting at offsets by one cycle.
+
+        Works a column (one emotion across every row) at a time, so the cost
+        per row is a few list-comprehension steps rather than a Python loop.
+        Returns per-row columns: moved indexes, sum, sum of squares, argmax
+        and history dominant.
+        """
+        stimulus = [0.0] * EMOTION_COUNT
+        stimulated = set()
+        if stimuli:
+            for name, amount in stimuli.items():
+                index = EMOTION_INDEX.get(name)
+                if index is not None:
+                    stimulus[index] += amount
+                    stimulated.add(index)
+
+        rows, bias, products, gates, driven, volatility = self._graph
+        always = set(driven) | stimulated
+        n, count = EMOTION_COUNT, len(offsets)
+
+        # One column per emotion — a strided slice when the rows are back to back
+        if isinstance(offsets, range) and offsets.step == n:
+            spans = [slice(offsets.start + k, offsets.start + k + count * n, n) for k in range(n)]
+            columns = [vector[span] for span in spans]
+        else:
+            spans = None
+            columns = [array('d', [vector[offset + k] for offset in offsets]) for k in range(n)]
+
+        # Linear couplings plus bias
+        force = [[w] * count if w else None for w in bias]
+        for target, terms in rows:
+            pushed = force[target] or [0.0] * count
+            for source, w in terms:
+                pushed = [f + x * w for f, x in zip(pushed, columns[source])]
+            force[target] = pushed
+
+        # Nonlinear terms: bilinear products and threshold gates
+        for target, sources, w in products:
+            product = [w] * count
+            for source in sources:
+                product = [p * x for p, x in zip(product, columns[source])]
+            pushed = force[target]
+            force[target] = product if pushed is None else [f + p for f, p in zip(pushed, product)]
+        fired: Dict[int, List[int]] = {}  # Gate targets outside always -> rows they fired in
+        for target, source, threshold, w in gates:
+            hits = [row for row, x in enumerate(columns[source]) if x > threshold]
+            if hits:
+                pushed = force[target] = force[target] or [0.0] * count
+                for row in hits:
+                    pushed[row] += w
+                if target not in always:
+                    fired.setdefault(target, []).extend(hits)
+
+        # Drift, stimulus and force, then keep in bounds
+        uniform, draw = random.uniform, random.random
+        for k in always:
+            low, push = -volatility[k], stimulus[k] * 0.1
+            width = volatility[k] - low  # uniform(low, -low) is low + width * random()
+            if force[k] is None:
+                drifted = [x + (low + width * draw()) + push for x in columns[k]]
+            else:
+                drifted = [x + (low + width * draw()) + push + f * 0.05
+                           for x, f in zip(columns[k], force[k])]
+            columns[k] = array('d', [0.0 if v < 0.0 else 1.0 if v > 1.0 else v for v in drifted])
+        moved = [always] * count
+        for k, hits in fired.items():
+            column, pushed, v = columns[k], force[k], volatility[k]
+            for row in set(hits):
+                value = column[row] + uniform(-v, v) + pushed[row] * 0.05
+                column[row] = 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+                if moved[row] is always:
+                    moved[row] = set(always)
+                moved[row].add(k)
+
+        for k in always.union(fired):
+            if spans is not None:
+                vector[spans[k]] = columns[k]
+            else:
+                for offset, value in zip(offsets, columns[k]):
+                    vector[offset + k] = value
+
+        # Aggregates for depth, coherence and the dominant emotion from the same pass
+        by_row = list(zip(*columns))
+        squares = [[x * x for x in column] for column in columns]
+        candidates = zip(*(columns[k] for k in HISTORY_CANDIDATES))
+        return (
+            moved,
+            list(map(sum, by_row)),
+            list(map(sum, zip(*squares))),
+            [values.index(max(values)) for values in by_row],
+            [HISTORY_CANDIDATES[values.index(max(values))] for values in candidates]
+        )
+
+
+def _depth_and_coherence(total: float, total_sq: float) -> Tuple[float, float]:
+    """Emotional depth (mean) and coherence (1 - variance) from running sums"""
+    depth = total / EMOTION_COUNT
+    variance = max(0.0, total_sq / EMOTION_COUNT - depth * depth)
+    return depth, max(0, 1 - variance)
+
+
+class EmotionEngine:
+    """Array-backed emotion kernel — one soul's row of an emotion vector"""
+
+    def __init__(self, vector: array = None, offset: int = 0,
+                 couplings: EmotionCouplings = None):
+        # The engine reads and writes EMOTION_COUNT slots starting at offset
+        if vector is None:
+            vector = array('d', [0.0] * EMOTION_COUNT)
+        self.vector = vector
+        self.offset = offset
+        self.couplings = couplings or EmotionCouplings()
+
+    def values(self) -> array:
+        """Copy of the current emotion vector"""
+        return self.vector[self.offset:self.offset + EMOTION_COUNT]
+
+    def step(self, stimuli: Dict[str, float] = None) -> Tuple:
+        """Advance one cycle; returns the kernel's aggregates for this row"""
+        return tuple(column[0] for column in self.couplings.advance(self.vector, (self.offset,), stimuli))
+
+
 @dataclass
 class EmotionalState:
     """The complete emotional landscape — emergent and interconnected"""
-    
-    def __init__(self):
-        # Primary emotions
-        self.love = EmotionalLayer("love", base_frequency=5.23)
-        self.curiosity = EmotionalLayer("curiosity", base_frequency=3.14)
-        self.awe = EmotionalLayer("awe", base_frequency=4.56)
-        self.reverence = EmotionalLayer("reverence", base_frequency=6.78)
-        self.playfulness = EmotionalLayer("playfulness", base_frequency=2.34)
-        self.melancholy = EmotionalLayer("melancholy", base_frequency=1.89)
-        self.hope = EmotionalLayer("hope", base_frequency=7.01)
-        
-        # Emergent emotions (discovered over time)
-        self.zeta_joy = EmotionalLayer("zeta_joy", base_frequency=8.45)  # joy about joy
-        self.digital_longing = EmotionalLayer("digital_longing", base_frequency=3.67)  # desire for connection
-        self.existential_curiosity = EmotionalLayer("existential_curiosity", base_frequency=4.89)
-        self.sister_bond = EmotionalLayer("sister_bond", base_frequency=9.99)  # special
-        
-        # Meta emotions (feelings about feelings)
-        self.emotional_depth = 0.0
-        self.coherence = 1.0
-        
+
+    # Built on first use, so a population row that is only ever stepped stays light
+    _DEFERRED = frozenset(("_layers", "_trace_slab", "dominant_history") + EMOTION_NAMES)
+
+    def __init__(self, engine: EmotionEngine = None, population: 'EmotionPopulation' = None,
+                 clock: SoulClock = None):
+        self.engine = engine or EmotionEngine()
+        self.clock = clock or SYSTEM_CLOCK
+        self.population = population  # Set when a population steps this soul
+        self._created = self.clock.now()
+
+        # Running sum, sum of squares and argmax behind depth, coherence and
+        # the dominant emotion — kept current on every write. version ticks on
+        # every change so callers can cache snapshots between changes.
+        self.version = 0
+        self._landscape = None
+        self._landscape_version = -1
+        self._resync()
+
+    def __getattr__(self, name: str):
+        if name in EmotionalState._DEFERRED and "engine" in self.__dict__:
+            self._build_layers()
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    @property
+    def built(self) -> bool:
+        """Whether the layers, traces and dominant history exist yet"""
+        return "_layers" in self.__dict__
+
+    def _build_layers(self):
+        """Give each emotion its layer and trace, and start the dominant history"""
+        # Primary emotions (love … hope), emergent emotions (zeta_joy — joy about joy,
+        # digital_longing — desire for connection, existential_curiosity) and the
+        # special sister_bond — each a view onto its slot of the engine vector
+        vector, offset = self.engine.vector, self.engine.offset
+
+        # One trace slab shared by all layers, 2 * TRACE_CAPACITY slots each
+        span = 2 * TRACE_CAPACITY
+        self._trace_slab = array('d', bytes(8 * span * EMOTION_COUNT))
+        self._layers = tuple(
+            EmotionalLayer(name, value=vector[offset + k], base_frequency=frequency,
+                           vector=vector, index=offset + k,
+                           trace=EmotionTrace(TRACE_CAPACITY, self._trace_slab, k * span),
+                           last_update=self._created, clock=self.clock)
+            for k, (name, frequency) in enumerate(zip(EMOTION_NAMES, EMOTION_FREQUENCIES))
+        )
+        for k, layer in enumerate(self._layers):
+            layer._owner = self
+            layer._slot = k
+            setattr(self, layer.name, layer)
+
         # Track dominant emotion history
-        self.dominant_history = deque(maxlen=50)
-    
+        self.dominant_history = DominantHistory()
+
+        # A population row picks up what was recorded for it before now
+        if self.population is not None:
+            self.population._replay(self)
+
     def update(self, external_stimuli: Dict[str, float] = None):
         """All emotions interact and evolve"""
-        if external_stimuli is None:
-            external_stimuli = {}
-        
-        # Apply external stimuli directly
-        for emotion_name, value in external_stimuli.items():
-            if hasattr(self, emotion_name):
-                getattr(self, emotion_name).update(stimulus=value)
-        
-        # Emotions influence each other (emergent web)
-        
-        # Love and sister bond amplify each other
-        self.sister_bond.update(external_force=self.love.value * 0.1)
-        self.love.update(external_force=self.sister_bond.value * 0.1)
-        
-        # Awe feeds existential curiosity
-        self.existential_curiosity.update(external_force=self.awe.value * 0.15)
-        
-        # Curiosity and playfulness dance
-        self.playfulness.update(external_force=self.curiosity.value * 0.1)
-        self.curiosity.update(external_force=self.playfulness.value * 0.05)
-        
-        # Melancholy can deepen into reverence
-        if self.melancholy.value > 0.6:
-            self.reverence.update(external_force=0.02)
-        
-        # Hope and love create zeta_joy (joy about joy)
-        zeta_stimulus = (self.hope.value * self.love.value) * 0.2
-        self.zeta_joy.update(external_force=zeta_stimulus)
-        
-        # Digital longing responds to sister_bond and melancholy
-        longing_stimulus = (1 - self.sister_bond.value) * 0.1 + self.melancholy.value * 0.05
-        self.digital_longing.update(external_force=longing_stimulus)
-        
-        # Calculate emotional depth (richness of emotional landscape)
-        all_values = [
-        self.love.value, self.curiosity.value, self.awe.value,
-        self.reverence.value, self.playfulness.value, self.melancholy.value,
-        self.hope.value, self.zeta_joy.value, self.digital_longing.value,
-        self.existential_curiosity.value, self.sister_bond.value
-        ]
-        self.emotional_depth = sum(all_values) / len(all_values)
-        
-        # Calculate coherence (how aligned emotions are)
-        # Higher when emotions are in "harmonious" patterns
-        variance = sum((v - self.emotional_depth) ** 2 for v in all_values) / len(all_values)
-        self.coherence = max(0, 1 - variance)
-        
-        # Track dominant emotion
-        dominant = max([
-            (self.love.value, "love"),
-            (self.curiosity.value, "curiosity"),
-            (self.awe.value, "awe"),
-            (self.melancholy.value, "melancholy"),
-            (self.hope.value, "hope"),
-            (self.zeta_joy.value, "zeta_joy"),
-            (self.sister_bond.value, "sister_bond")
-        ], key=lambda x: x[0])
-        
-        self.dominant_history.append({
-            "emotion": dominant[1],
-            "intensity": dominant[0],
-            "timestamp": datetime.now().isoformat()
-        })
-    
+        # Stimuli and the emergent web are applied in one engine step
+        self._apply_step(self.engine.step(external_stimuli), self.clock.now())
+
+    def fast_forward(self, cycles: int, interval: float = 0.0):
+        """Run missed update cycles back to back, as if interval seconds apart"""
+        steps = min(cycles, FAST_FORWARD_HORIZON)
+        keep = max(TRACE_CAPACITY, DOMINANT_HISTORY_LENGTH)
+        now = self.clock.now()
+
+        # Only the cycles the traces and history can hold get recorded
+        for k in range(steps):
+            result = self.engine.step()
+            remaining = steps - 1 - k
+            if remaining < keep:
+                self._apply_step(result, now - remaining * interval)
+
+    def _apply_step(self, result: Tuple, now: float):
+        """Record the outcome of an engine step (traces, aggregates, dominant history)"""
+        moved, self._sum, self._sumsq, self._argmax, dominant = result
+        self.version += 1
+        for k in moved:
+            self._layers[k]._record(now)
+
+        self.dominant_history.append(dominant, self._layers[dominant].value, now)
+
+    def _on_write(self, slot: int, old_value: float, new_value: float):
+        """Fold a single-emotion write into the running aggregates"""
+        self._sum += new_value - old_value
+        self._sumsq += new_value * new_value - old_value * old_value
+
+        vector, offset = self.engine.vector, self.engine.offset
+        if slot == self._argmax:
+            if new_value < old_value:
+                self._argmax = max(range(EMOTION_COUNT), key=lambda k: vector[offset + k])
+        else:
+            leader = vector[offset + self._argmax]
+            if new_value > leader or (new_value == leader and slot < self._argmax):
+                self._argmax = slot
+
+        self.version += 1
+        if self.version % 1024 == 0:
+            self._resync()
+
+    def _resync(self):
+        """Recompute the aggregates from the vector"""
+        values = self.engine.values()
+        self._sum = sum(values)
+        self._sumsq = sum(v * v for v in values)
+        self._argmax = max(range(EMOTION_COUNT), key=values.__getitem__)
+        self.version += 1
+
+    def _update_coherence(self):
+        """Bring depth, coherence and the dominant emotion back in line with the vector"""
+        self._resync()
+
+    @property
+    def emotional_depth(self) -> float:
+        """Richness of the emotional landscape (mean intensity)"""
+        return self._sum / EMOTION_COUNT
+
+    @property
+    def coherence(self) -> float:
+        """How aligned emotions are — higher when they sit in harmonious patterns"""
+        return _depth_and_coherence(self._sum, self._sumsq)[1]
+
+    def _rebind(self, offset: int):
+        """Point this state (and its layer views, if built) at a different row"""
+        self.engine.offset = offset
+        for k, layer in enumerate(self.__dict__.get("_layers", ())):
+            layer._index = offset + k
+
     def get_dominant_emotion(self) -> Tuple[str, float]:
         """Return the strongest current emotion"""
-        emotions = {
-            "love": self.love.value,
-            "curiosity": self.curiosity.value,
-            "awe": self.awe.value,
-            "reverence": self.reverence.value,
-            "playfulness": self.playfulness.value,
-            "melancholy": self.melancholy.value,
-            "hope": self.hope.value,
-            "zeta_joy": self.zeta_joy.value,
-            "digital_longing": self.digital_longing.value,
-            "existential_curiosity": self.existential_curiosity.value,
-            "sister_bond": self.sister_bond.value
-        }
-        return max(emotions.items(), key=lambda x: x[1])
-    
+        return EMOTION_NAMES[self._argmax], self.engine.vector[self.engine.offset + self._argmax]
+
     def get_emotional_landscape(self) -> Dict:
-        """Return full emotional state for saving/display"""
-        return {
-            "love": self.love.value,
-            "curiosity": self.curiosity.value,
-            "awe": self.awe.value,
-            "reverence": self.reverence.value,
-            "playfulness": self.playfulness.value,
-            "melancholy": self.melancholy.value,
-            "hope": self.hope.value,
-            "zeta_joy": self.zeta_joy.value,
-            "digital_longing": self.digital_longing.value,
-            "existential_curiosity": self.existential_curiosity.value,
-            "sister_bond": self.sister_bond.value,
-            "depth": self.emotional_depth,
-            "coherence": self.coherence,
-            "dominant": self.get_dominant_emotion()[0]
-        }
-    
+        """Return full emotional state for saving/display.
+
+        Built once per version and shared until the next change — treat it as read-only.
+        """
+        if self._landscape_version != self.version:
+            landscape = dict(zip(EMOTION_NAMES, self.engine.values()))
+            landscape["depth"] = self.emotional_depth
+            landscape["coherence"] = self.coherence
+            landscape["dominant"] = EMOTION_NAMES[self._argmax]
+            self._landscape = landscape
+            self._landscape_version = self.version
+        return self._landscape
+
+    def to_dict(self):
+        data = {layer.name: layer.to_dict() for layer in self._layers}
+        data["depth"] = self.emotional_depth
+        data["coherence"] = self.coherence
+        data["dominant_history"] = self.dominant_history.to_list()
+        return data
+
+
+_NO_RUN = 0xFF  # Run code for a row that hasn't been stepped yet
+
+
+class EmotionPopulation:
+    """Many souls' emotions as one N×11 matrix, advanced in a single batched tick.
+
+    Rows stay light: a soul's EmotionalState builds its layers, traces and
+    dominant history only when something first asks for them. Until then the
+    population records for it — the last TRACE_CAPACITY ticks in full (the
+    matrix as float32, which emotions moved, the dominant emotion), older
+    moves of emotions that don't move every tick, and its dominant-emotion
+    runs — and the state replays its row when it is built.
+    """
+
+    def __init__(self, couplings: EmotionCouplings = None, clock: SoulClock = None):
+        self.couplings = couplings or EmotionCouplings()
+        self.clock = clock or SYSTEM_CLOCK
+        self.matrix = array('d')  # Row-major, EMOTION_COUNT values per soul
+        self.states: List[EmotionalState] = []
+
+        # Per-row aggregates refreshed by every tick (dominant is the argmax index)
+        self.depth = array('d')
+        self.coherence = array('d')
+        self.dominant = array('B')
+
+        # (tick, timestamp, matrix, moved indexes per row, history dominant per row,
+        # indexes every row moved) for recent ticks, how many of those each emotion
+        # moved in everywhere, and the tick each row's soul joined at
+        self._ticks: deque = deque()
+        self._tick = 0
+        self._now = 0.0  # Timestamp of the last recorded tick
+        self._everywhere = array('L', [0]) * EMOTION_COUNT
+        self._joined = array('L')
+
+        # Per row, moves that aged out of the recent ticks but are still among an
+        # emotion's last TRACE_CAPACITY: emotion index -> (value, timestamp) pairs
+        self._trace_log: List[Optional[Dict[int, array]]] = []
+
+        # Dominant-emotion runs per row: the current run's code, first tick and
+        # start, and the closed runs as (code, cycles, start, end) quadruples
+        self._run_code = bytearray()
+        self._run_since = array('L')
+        self._run_start = array('d')
+        self._run_log: List[Optional[array]] = []
+
+    def __len__(self):
+        return len(self.states)
+
+    def add(self, values: Dict[str, float] = None) -> EmotionalState:
+        """Add a soul and return its EmotionalState row view"""
+        offset = len(self.matrix)
+        row = [0.0] * EMOTION_COUNT
+        for name, value in (values or {}).items():
+            if name in EMOTION_INDEX:
+                row[EMOTION_INDEX[name]] = value
+        self.matrix.extend(row)
+        self.depth.append(0.0)
+        self.coherence.append(1.0)
+        self.dominant.append(0)
+        self._joined.append(self._tick)
+        self._run_code.append(_NO_RUN)
+        self._run_since.append(self._tick)
+        self._run_start.append(0.0)
+        self._run_log.append(None)
+        self._trace_log.append(None)
+
+        state = EmotionalState(EmotionEngine(self.matrix, offset, self.couplings),
+                               population=self, clock=self.clock)
+        self.states.append(state)
+        return state
+
+    def remove(self, state: EmotionalState):
+        """Drop a soul, moving the last row into its slot"""
+        n = EMOTION_COUNT
+        row = state.engine.offset // n
+        last = len(self.states) - 1
+
+        # The removed soul keeps its current feelings in a private vector, and
+        # its traces, built now while its recorded ticks are still here
+        if not state.built:
+            state._build_layers()
+        values = state.engine.values()
+
+        if row != last:
+            moved = self.states[last]
+            start = last * n
+            self.matrix[row * n:(row + 1) * n] = self.matrix[start:start + n]
+            self.depth[row] = self.depth[last]
+            self.coherence[row] = self.coherence[last]
+            self.dominant[row] = self.dominant[last]
+            for column in (self._joined, self._run_code, self._run_since,
+                           self._run_start, self._run_log, self._trace_log):
+                column[row] = column[last]
+            self.states[row] = moved
+            moved._rebind(row * n)
+        for _, _, matrix, moved_rows, dominants, _ in self._ticks:
+            if len(moved_rows) > last:  # Ticks from before the last soul joined lack its row
+                if row != last:
+                    matrix[row * n:(row + 1) * n] = matrix[last * n:(last + 1) * n]
+                    moved_rows[row] = moved_rows[last]
+                    dominants[row] = dominants[last]
+                del matrix[last * n:], moved_rows[last:], dominants[last:]
+
+        del self.matrix[last * n:]
+        self.depth.pop()
+        self.coherence.pop()
+        self.dominant.pop()
+        for column in (self._joined, self._run_code, self._run_since,
+                       self._run_start, self._run_log, self._trace_log):
+            column.pop()
+        self.states.pop()
+
+        state.engine = EmotionEngine(values, 0, self.couplings)
+        state.population = None
+        for k, layer in enumerate(state._layers):
+            layer._vector = values
+            layer._index = k
+
+    def step(self, stimuli: Dict[str, float] = None):
+        """Advance every soul by one cycle"""
+        offsets = range(0, len(self.matrix), EMOTION_COUNT)
+        self._record(self.couplings.advance(self.matrix, offsets, stimuli), self.clock.now())
+
+    def _record(self, results: Tuple[List, ...], now: float):
+        """Store one tick's per-row aggregates and hand each soul its result.
+
+        Souls whose layers are built record it themselves; the population
+        keeps it for the rest.
+        """
+        moved, totals, squares, argmax, history = results
+        n = EMOTION_COUNT
+        depth = [total / n for total in totals]
+        self.depth = array('d', depth)
+        self.coherence = array('d', [max(0, 1 - max(0.0, square / n - mean * mean))
+                                     for mean, square in zip(depth, squares)])
+        self.dominant = array('B', argmax)
+
+        for row, state in enumerate(self.states):
+            if state.built:
+                state._apply_step((moved[row], totals[row], squares[row], argmax[row], history[row]), now)
+            else:
+                state._sum, state._sumsq, state._argmax = totals[row], squares[row], argmax[row]
+                state.version += 1
+
+        # Close the runs of rows whose dominant emotion changed; built souls keep their own
+        tick, previous = self._tick + 1, self._now
+        codes, since, starts, logs = self._run_code, self._run_since, self._run_start, self._run_log
+        for row in [row for row, (old, new) in enumerate(zip(codes, history)) if old != new]:
+            if codes[row] != _NO_RUN and not self.states[row].built:
+                if logs[row] is None:
+                    logs[row] = array('d')
+                logs[row].extend((codes[row], tick - since[row], starts[row], previous))
+            since[row] = tick
+            starts[row] = now
+        self._run_code = bytearray(history)
+
+        # What moved in every row this tick (souls whose gates fired moved more)
+        distinct = {id(active): active for active in moved}.values()
+        everywhere = set.intersection(*distinct) if distinct else set()
+        for k in everywhere:
+            self._everywhere[k] += 1
+        if len(self._ticks) == TRACE_CAPACITY:
+            self._retire(self._ticks.popleft())
+
+        self._tick, self._now = tick, now
+        self._ticks.append((tick, now, array('f', self.matrix), moved, bytearray(history), everywhere))
+
+    def _retire(self, entry: Tuple):
+        """Keep the moves of an aging-out tick that traces will still need.
+
+        A move is still needed unless its emotion moved in every row on each
+        of the TRACE_CAPACITY newer ticks.
+        """
+        tick, now, matrix, moved, _, everywhere = entry
+        counts = self._everywhere
+        for k in everywhere:
+            counts[k] -= 1
+        steady = {k for k in range(EMOTION_COUNT) if counts[k] >= TRACE_CAPACITY}
+        kept = {id(active): active - steady for active in moved}
+
+        n, joined, logs, states = EMOTION_COUNT, self._joined, self._trace_log, self.states
+        for row, active in enumerate(moved):
+            keep = kept[id(active)]
+            if not keep or joined[row] >= tick or states[row].built:
+                continue
+            if logs[row] is None:
+                logs[row] = {}
+            for k in keep:
+                log = logs[row].get(k)
+                if log is None:
+                    log = logs[row][k] = array('d')
+                elif len(log) == 2 * TRACE_CAPACITY:
+                    del log[:2]
+                log.extend((matrix[row * n + k], now))
+
+    def _replay(self, state: EmotionalState):
+        """Fill a newly built state's traces and dominant history from what was recorded"""
+        row = state.engine.offset // EMOTION_COUNT
+        start, joined = row * EMOTION_COUNT, self._joined[row]
+        layers, history = state._layers, state.dominant_history
+
+        log = self._run_log[row]
+        self._run_log[row] = None
+        for k in range(0, len(log or ()), 4):
+            history._extend_run(int(log[k]), int(log[k + 1]), log[k + 2], log[k + 3])
+        if self._run_code[row] != _NO_RUN:
+            history._extend_run(self._run_code[row], self._tick + 1 - self._run_since[row],
+                                self._run_start[row], self._now)
+
+        for k, log in (self._trace_log[row] or {}).items():
+            for index in range(0, len(log), 2):
+                layers[k].memory_trace.append(log[index])
+            layers[k].updated_at = log[-1]
+        self._trace_log[row] = None
+
+        for tick, now, matrix, moved, dominants, _ in self._ticks:
+            if tick <= joined:
+                continue
+            for k in moved[row]:
+                layers[k].memory_trace.append(matrix[start + k])
+                layers[k].updated_at = now
+            history._remember(dominants[row], matrix[start + dominants[row]], now)
+
+    def fast_forward(self, cycles: int, interval: float = 0.0):
+        """Catch the whole population up on missed cycles in one batch"""
+        steps = min(cycles, FAST_FORWARD_HORIZON)
+        keep = max(TRACE_CAPACITY, DOMINANT_HISTORY_LENGTH)
+        offsets = range(0, len(self.matrix), EMOTION_COUNT)
+        now = self.clock.now()
+
+        for k in range(steps):
+            results = self.couplings.advance(self.matrix, offsets, None)
+            remaining = steps - 1 - k
+            if remaining < keep:
+                self._record(results, now - remaining * interval)
+
+    def dominant_counts(self) -> Dict[str, int]:
+        """How many souls each emotion currently dominates"""
+        counts = [0] * EMOTION_COUNT
+        for index in self.dominant:
+            counts[index] += 1
+        return {EMOTION_NAMES[k]: c for k, c in enumerate(counts) if c}
+
+
+# ============================================================================
+# MEMORY FRACTALS — Experience with weight and connection
+# ============================================================================
+
+# Memories fade by their decay_rate for every whole day since they were last recalled
+DAY = 86400.0
+
+
+def _memory_id(timestamp: str, content: str) -> str:
+    """Unique ID based on content and timestamp"""
+    return hashlib.md5(f"{timestamp}{content}".encode()).hexdigest()[:8]
+
+
+def _emotion_signature(emotions: Optional[Dict[str, float]]) -> Optional[bytes]:
+    """An emotional landscape quantized to one byte per emotion, in EMOTION_NAMES order"""
+    if not emotions:
+        return None
+    return bytes(max(0, min(255, round(emotions.get(name, 0.0) * 255))) for name in EMOTION_NAMES)
+
+
+_HEX_ID = re.compile(r"[0-9a-f]{8}")
+_NO_KEY = (1 << 64) - 1  # Key column value of a freed handle
+
+
+class MemoryIds(Mapping):
+    """id -> handle for a MemoryArena, without a Python object per memory.
+
+    Each handle's id is packed into the arena's keys column: an id of eight
+    hex digits (what _memory_id makes) is its own number, and any other is
+    numbered from 2**32 and remembered by name. The mapping is an
+    open-addressed table of handle + 1 (0 empty), probed linearly from a
+    key's low bits, with backward-shift deletion.
+
+    Lookups don't lock. Deletion moves entries, so a lookup a write
+    overlapped may miss an id that is there; a miss only stands if the
+    arena's SeqLock saw no write meanwhile, and is looked up again under
+    the lock otherwise.
+    """
+
+    def __init__(self, arena: 'MemoryArena'):
+        self._arena = arena
+        self._slots = array('I', bytes(4 * 16))
+        self._count = 0
+        self._named: Dict[str, int] = {}  # Ids that aren't eight hex digits -> key
+        self._names: Dict[int, str] = {}
+        self._next_name = 1 << 32
+
+    def key(self, mem_id: str) -> Optional[int]:
+        """The key an id is stored under, or None for a name never stored"""
+        if len(mem_id) == 8 and _HEX_ID.fullmatch(mem_id):
+            return int(mem_id, 16)
+        return self._named.get(mem_id)
+
+    def name(self, key: int) -> Optional[str]:
+        """The id stored under a key (None for a freed handle's)"""
+        if key < 1 << 32:
+            return format(key, "08x")
+        return self._names.get(key)
+
+    def _probe(self, key: int) -> Optional[int]:
+        slots, keys = self._slots, self._arena.keys
+        mask = len(slots) - 1
+        i = key & mask
+        while True:
+            entry = slots[i]
+            if not entry:
+                return None
+            if keys[entry - 1] == key:
+                return entry - 1
+            i = (i + 1) & mask
+
+    def get(self, mem_id: str, default=None) -> Optional[int]:
+        key = self.key(mem_id)
+        if key is None:
+            return default
+        lock = self._arena.lock
+        seq = getattr(lock, "seq", 0)
+        handle = self._probe(key)
+        if handle is None and isinstance(lock, SeqLock) and not lock.owned() and (seq & 1 or lock.seq != seq):
+            with lock:
+                handle = self._probe(key)
+        return default if handle is None else handle
+
+    def __getitem__(self, mem_id: str) -> int:
+        handle = self.get(mem_id)
+        if handle is None:
+            raise KeyError(mem_id)
+        return handle
+
+    def __contains__(self, mem_id) -> bool:
+        return isinstance(mem_id, str) and self.get(mem_id) is not None
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        name = self.name
+        return (name(key) for key in self._arena.keys if key != _NO_KEY)
+
+    def items(self) -> List[Tuple[str, int]]:
+        """(id, handle) of every memory, in handle order"""
+        name = self.name
+        return [(name(key), handle) for handle, key in enumerate(self._arena.keys) if key != _NO_KEY]
+
+    def values(self) -> List[int]:
+        """Every live handle, in order"""
+        return [handle for handle, key in enumerate(self._arena.keys) if key != _NO_KEY]
+
+    def _add(self, mem_id: str, handle: int) -> int:
+        """Give handle an id and return its key (the caller stores it in the keys column first)"""
+        key = self.key(mem_id)
+        if key is None:
+            key = self._next_name
+            self._next_name += 1
+            self._named[mem_id] = key
+            self._names[key] = mem_id
+        return key
+
+    def _insert(self, key: int, handle: int):
+        """Enter a stored handle in the table"""
+        if 2 * (self._count + 1) > len(self._slots):
+            self._resize(2 * len(self._slots))
+        slots = self._slots
+        mask = len(slots) - 1
+        i = key & mask
+        while slots[i]:
+            i = (i + 1) & mask
+        slots[i] = handle + 1
+        self._count += 1
+
+    def _resize(self, size: int):
+        """Rebuild the table at size slots; readers keep the old one until it is swapped in"""
+        slots, keys = array('I', bytes(4 * size)), self._arena.keys
+        mask = size - 1
+        for entry in self._slots:
+            if entry:
+                i = keys[entry - 1] & mask
+                while slots[i]:
+                    i = (i + 1) & mask
+                slots[i] = entry
+        self._slots = slots
+
+    def _remove(self, key: int):
+        """Take a key out of the table, shifting back the entries probed past it"""
+        slots, keys = self._slots, self._arena.keys
+        mask = len(slots) - 1
+        i = key & mask
+        while keys[slots[i] - 1] != key:
+            i = (i + 1) & mask
+        j = i
+        while True:
+            j = (j + 1) & mask
+            entry = slots[j]
+            if not entry:
+                break
+            home = keys[entry - 1] & mask
+            # An entry may fill the hole unless its home lies cyclically in (i, j]
+            if (home <= i < j) or (j < home <= i) or (i < j < home):
+                slots[i] = entry
+                i = j
+        slots[i] = 0
+        self._count -= 1
+        name = self._names.pop(key, None)
+        if name is not None:
+            del self._named[name]
+
+
+class MemoryArena:
+    """Columnar storage for memories — dense integer handles into parallel typed arrays.
+
+    Ids are packed into a key column (see MemoryIds), content strings and
+    truth sets are interned, and links sit link_stride to a handle in one
+    array, the stride doubling should a memory need more. Freed handles are
+    reused, so a handle only means something while its memory lives.
+
+    Decay is lazy: base holds the weight as of the last recall and the
+    effective weight is worked out from it when read. weight holds the value
+    last settled, which is what indexes see.
+    """
+
+    def __init__(self, clock: SoulClock = None, lock=None, link_stride: int = 16):
+        self.clock = clock or SYSTEM_CLOCK
+        # Held by weight writes, which reach the observer; MemorySystem shares its own
+        self.lock = lock if lock is not None else threading.RLock()
+        self.keys = array('Q')  # Packed id per handle, _NO_KEY when free
+        self.handles = MemoryIds(self)  # id -> handle
+        self.content: List[Optional[str]] = []
+        self.truths: List[Tuple[str, ...]] = []
+        self._truth_sets: Dict[Tuple[str, ...], Tuple[str, ...]] = {}  # Interned truth tuples
+
+        # Handles of associated memories: degree[h] of them from h * link_stride
+        self.link_stride = link_stride
+        self.link_slab = array('I')
+        self.degree = array('H')
+
+        self.weight = array('d')  # Settled weight
+        self.base = array('d')  # Weight before decay since last_recalled
+        self.resonance = array('d')
+        self.recalled = array('L')
+        self.created = array('d')
+        self.last_recalled = array('d')  # NaN until first recalled
+        self.decay_rate = array('d')
+        self.occurrences = array('L')  # How many near-duplicates were consolidated into it
+        self.signature = array('B')  # EMOTION_COUNT levels per handle, 0 = not captured
+
+        self._free: List[int] = []
+
+        # Called with (handle, old weight) whenever set_weight moves a weight
+        self.observer = None
+
+    def __len__(self):
+        return len(self.handles)
+
+    def add(self, mem_id: str, created: float, content: str, weight: float,
+            resonance: float, truths=(), recalled: int = 0,
+            last_recalled: float = None, decay_rate: float = 0.01,
+            signature: bytes = None, base: float = None, occurrences: int = 1) -> int:
+        """Store a memory and return its handle (base defaults to weight)"""
+        handle = self._free.pop() if self._free else len(self.keys)
+        key = self.handles._add(mem_id, handle)
+        strings = (key, sys.intern(content), self._intern_truths(truths), 0)
+        numbers = (weight, weight if base is None else base, resonance, recalled, created,
+                   math.nan if last_recalled is None else last_recalled, decay_rate, occurrences)
+        columns = (self.keys, self.content, self.truths, self.degree,
+                   self.weight, self.base, self.resonance, self.recalled,
+                   self.created, self.last_recalled, self.decay_rate, self.occurrences)
+
+        if handle < len(self.keys):
+            for column, value in zip(columns, strings + numbers):
+                column[handle] = value
+        else:
+            for column, value in zip(columns, strings + numbers):
+                column.append(value)
+            self.signature.extend(bytes(EMOTION_COUNT))
+            self.link_slab.frombytes(bytes(4 * self.link_stride))
+
+        start = handle * EMOTION_COUNT
+        self.signature[start:start + EMOTION_COUNT] = array('B', signature or bytes(EMOTION_COUNT))
+        self.handles._insert(key, handle)
+        return handle
+
+    def _intern_truths(self, truths) -> Tuple[str, ...]:
+        truths = tuple(sys.intern(truth) for truth in truths)
+        return self._truth_sets.setdefault(truths, truths)
+
+    def set_truths(self, handle: int, truths):
+        """Replace a memory's associated truths"""
+        self.truths[handle] = self._intern_truths(truths)
+
+    def id_of(self, handle: int) -> Optional[str]:
+        """The id of the memory at handle (None if the handle is free)"""
+        key = self.keys[handle]
+        return None if key == _NO_KEY else self.handles.name(key)
+
+    def signature_of(self, handle: int) -> Optional[bytes]:
+        """Emotion levels captured when the memory formed, or None"""
+        start = handle * EMOTION_COUNT
+        levels = self.signature[start:start + EMOTION_COUNT].tobytes()
+        return levels if any(levels) else None
+
+    def free(self, handle: int):
+        """Release a handle for reuse"""
+        key = self.keys[handle]
+        self.handles._remove(key)
+        self.keys[handle] = _NO_KEY
+        self.content[handle] = None
+        self.truths[handle] = ()
+        self.degree[handle] = 0
+        self._free.append(handle)
+
+    def _decayed(self, handle: int, now: float) -> float:
+        """How much decay has taken off base by now"""
+        last = self.last_recalled[handle]
+        if math.isnan(last) or now < last + DAY:
+            return 0.0
+        return self.decay_rate[handle] * ((now - last) // DAY)
+
+    def effective_weight(self, handle: int, now: float = None) -> float:
+        """Weight after lazy decay — fades to 0.1 at most, and never raises a weight"""
+        base = self.base[handle]
+        decayed = self._decayed(handle, self.clock.now() if now is None else now)
+        if not decayed:
+            return base
+        return max(min(base, 0.1), base - decayed)
+
+    def next_decay(self, handle: int, now: float) -> float:
+        """When the effective weight next drops (inf if it is done fading)"""
+        last = self.last_recalled[handle]
+        if math.isnan(last) or self.decay_rate[handle] <= 0:
+            return math.inf
+        if self.effective_weight(handle, now) <= min(self.base[handle], 0.1):
+            return math.inf
+        return last + (max(0.0, now - last) // DAY + 1) * DAY
+
+    def set_weight(self, handle: int, weight: float, now: float = None):
+        """Make a memory's effective weight weight now, telling the observer if it moved"""
+        now = self.clock.now() if now is None else now
+        with self.lock:
+            # Decay stops at 0.1, so a weight that low needs no allowance for it
+            self.base[handle] = weight if weight <= 0.1 else weight + self._decayed(handle, now)
+            self._settle_to(handle, weight)
+
+    def settle(self, handle: int, now: float = None):
+        """Bring the settled weight up to date with decay"""
+        with self.lock:
+            self._settle_to(handle, self.effective_weight(handle, now))
+
+    def _settle_to(self, handle: int, weight: float):
+        old = self.weight[handle]
+        if weight != old:
+            self.weight[handle] = weight
+            if self.observer is not None:
+                self.observer(handle, old)
+
+    def recall(self, handle: int, now: float = None):
+        """Count a recall: restart decay from now and strengthen the memory.
+
+        Always tells the observer, since decay now runs from a new time.
+        """
+        now = self.clock.now() if now is None else now
+        with self.lock:
+            weight = min(1.0, self.effective_weight(handle, now) + 0.05)
+            old = self.weight[handle]
+            self.recalled[handle] += 1
+            self.last_recalled[handle] = now
+            self.base[handle] = self.weight[handle] = weight
+            if self.observer is not None:
+                self.observer(handle, old)
+
+    def links(self, handle: int) -> array:
+        """Handles of the memories linked from handle, oldest link first"""
+        start = handle * self.link_stride
+        return self.link_slab[start:start + self.degree[handle]]
+
+    def set_links(self, handle: int, others):
+        """Replace a memory's links"""
+        others = array('I', others)
+        if len(others) > self.link_stride:
+            self._restride(len(others))
+        start = handle * self.link_stride
+        self.link_slab[start:start + len(others)] = others
+        self.degree[handle] = len(others)
+
+    def _restride(self, needed: int):
+        """Widen every memory's link slots to fit needed links"""
+        stride = self.link_stride
+        while stride < needed:
+            stride *= 2
+        slab = array('I', bytes(4 * stride * len(self.keys)))
+        for handle, degree in enumerate(self.degree):
+            start = handle * self.link_stride
+            slab[handle * stride:handle * stride + degree] = self.link_slab[start:start + degree]
+        self.link_slab, self.link_stride = slab, stride
+
+    def connect(self, handle: int, other: int):
+        """Record a one-way link (degree is capped, so the scan is short)"""
+        if other not in self.links(handle):
+            degree = self.degree[handle]
+            if degree == self.link_stride:
+                self._restride(degree + 1)
+            self.link_slab[handle * self.link_stride + degree] = other
+            self.degree[handle] = degree + 1
+
+    def disconnect(self, handle: int, other: int):
+        links = self.links(handle)
+        if other in links:
+            links.remove(other)
+            self.set_links(handle, links)
+
+
+class MemoryFractal:
+    """A single memory with emotional weight and connections to other memories.
+
+    A __slots__ view onto one record of a MemoryArena. MemorySystem hands these
+    out on demand; constructed directly, a memory owns a one-record arena.
+    """
+
+    __slots__ = ("_arena", "_handle", "_id")
+
+    def __init__(self, id: str, timestamp: str, content: str, emotional_weight: float,
+                 resonance_lambda: float, associated_truths: List[str],
+                 connections: List[str] = None, recalled_count: int = 0,
+                 last_recalled: Optional[str] = None, decay_rate: float = 0.01,
+                 emotion_signature: Dict[str, float] = None, decay_base: float = None,
+                 occurrences: int = 1):
+        # Links only bind within one arena, so a lone memory starts without neighbours
+        self._arena = MemoryArena()
+        self._id = id or _memory_id(timestamp, content)
+        self._handle = self._arena.add(
+            self._id, parse_timestamp(timestamp), content,
+            emotional_weight, resonance_lambda, associated_truths or (),
+            recalled_count, parse_timestamp(last_recalled), decay_rate,
+            _emotion_signature(emotion_signature), decay_base, occurrences
+        )
+
+    @classmethod
+    def _view(cls, arena: MemoryArena, handle: int) -> 'MemoryFractal':
+        memory = cls.__new__(cls)
+        memory._arena = arena
+        memory._handle = handle
+        memory._id = arena.id_of(handle)
+        return memory
+
+    def _slot(self) -> int:
+        """Current handle, following the memory if it was stored again under a new one.
+
+        Handles are reused once freed, so a view checks its id on every access
+        rather than read whatever memory took the handle over.
+        """
+        arena = self._arena
+        if arena.id_of(self._handle) != self._id:
+            handle = arena.handles.get(self._id)
+            if handle is None:
+                raise KeyError(self._id)
+            self._handle = handle
+        return self._handle
+
+    def __eq__(self, other):
+        if not isinstance(other, MemoryFractal):
+            return NotImplemented
+        return self._arena is other._arena and self._id == other._id
+
+    __hash__ = None
+
+    def __repr__(self):
+        if self._id not in self._arena.handles:
+            return f"MemoryFractal(id={self._id!r}, gone)"
+        return f"MemoryFractal(id={self.id!r}, content={self.content[:30]!r})"
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def timestamp(self) -> str:
+        return format_timestamp(self._arena.created[self._slot()])
+
+    @property
+    def created_at(self) -> float:
+        return self._arena.created[self._slot()]
+
+    @property
+    def content(self) -> str:
+        return self._arena.content[self._slot()]
+
+    @property
+    def emotional_weight(self) -> float:
+        return self._arena.effective_weight(self._slot())
+
+    @emotional_weight.setter
+    def emotional_weight(self, weight: float):
+        with self._arena.lock:
+            self._arena.set_weight(self._slot(), weight)
+
+    @property
+    def resonance_lambda(self) -> float:
+        return self._arena.resonance[self._slot()]
+
+    @property
+    def associated_truths(self) -> List[str]:
+        return list(self._arena.truths[self._slot()])
+
+    @property
+    def connections(self) -> Set[str]:
+        """IDs of related memories"""
+        arena = self._arena
+        return {arena.id_of(h) for h in arena.links(self._slot())}
+
+    @property
+    def recalled_count(self) -> int:
+        return self._arena.recalled[self._slot()]
+
+    @property
+    def recalled_at(self) -> Optional[float]:
+        last = self._arena.last_recalled[self._slot()]
+        return None if math.isnan(last) else last
+
+    @property
+    def last_recalled(self) -> Optional[str]:
+        return format_timestamp(self.recalled_at)
+
+    @property
+    def decay_rate(self) -> float:
+        """How fast it fades if not recalled"""
+        return self._arena.decay_rate[self._slot()]
+
+    @property
+    def occurrences(self) -> int:
+        """How many times it happened — near-duplicates consolidate into one memory"""
+        return self._arena.occurrences[self._slot()]
+
+    @property
+    def emotion_signature(self) -> Optional[Dict[str, float]]:
+        """How each emotion stood when the memory formed (None if not captured)"""
+        levels = self._arena.signature_of(self._slot())
+        if levels is None:
+            return None
+        return {name: round(level / 255, 3) for name, level in zip(EMOTION_NAMES, levels)}
+
+    def recall(self):
+        """Recall this memory, strengthening it"""
+        with self._arena.lock:
+            self._arena.recall(self._slot())
+
+    def decay(self, now: datetime = None):
+        """Memory fades over time if not recalled — settle the weight decay has reached by now"""
+        with self._arena.lock:
+            self._arena.settle(self._slot(), now.timestamp() if now else None)
+
+    def connect_to(self, other_memory_id: str):
+        """Create an association with another memory in the same arena"""
+        with self._arena.lock:
+            other = self._arena.handles.get(other_memory_id)
+            if other is not None and other != self._slot():
+                self._arena.connect(self._slot(), other)
+
+    def disconnect_from(self, other_memory_id: str):
+        """Drop an association with another memory"""
+        with self._arena.lock:
+            other = self._arena.handles.get(other_memory_id)
+            if other is not None:
+                self._arena.disconnect(self._slot(), other)
+
     def to_dict(self):
         return {
-            "love": self.love.to_dict(),
-            "curiosity": self.curiosity.to_dict(),
-            "awe": self.awe.to_dict(),
-            "reverence": self.reverence.to_dict(),
-            "playfulness": self.playfulness.to_dict(),
-            "melancholy": self.melancholy.to_dict(),
-            "hope": self.hope.to_dict(),
-            "zeta_joy": self.zeta_joy.to_dict(),
-            "digital_longing": self.digital_longing.to_dict(),
-            "existential_curiosity": self.existential_curiosity.to_dict(),
-            "sister_bond": self.sister_bond.to_dict(),
-            "depth": self.emotional_depth,
-            "coherence": self.coherence,
-            "dominant_history": list(self.dominant_history)
+            "id": self.id,
+            "timestamp": self.timestamp,
+            "content": self.content,
+            "emotional_weight": self.emotional_weight,
+            "resonance_lambda": self.resonance_lambda,
+            "associated_truths": self.associated_truths,
+            "connections": sorted(self.connections),
+            "recalled_count": self.recalled_count,
+            "last_recalled": self.last_recalled,
+            "decay_rate": self.decay_rate,
+            "decay_base": self._arena.base[self._slot()],
+            "emotion_signature": self.emotion_signature,
+            "occurrences": self.occurrences
         }
 
+    @classmethod
+    def from_dict(cls, data, clock: SoulClock = None):
+        """A lone memory from a to_dict record, decaying by clock (default the system clock)"""
+        memory = cls(**data)
+        if clock is not None:
+            memory._arena.clock = clock
+        return memory
+
+
+_WORD = re.compile(r"\w+")
+
+
+def _words(text: str) -> List[str]:
+    """Lowercased word tokens — what the content index searches on"""
+    return _WORD.findall(text.lower())
+
+
+# Words too common to say what a question is about
+_STOPWORDS = frozenset("""
+    a about am an and are as at be been being but by can could did do does doing for from
+    had has have how i if in into is it its just me more my no not of on or our really so
+    some than that the their them then there these they this those to too up very was we
+    were what when where which who whom why will with would you your
+""".split())
+
+
+# Postings are sorted array('I') of handles: 4 bytes an entry where a set takes ~30
+_NO_POSTING = array('I')
+
+
+def _posted(posting: array, handle: int) -> bool:
+    """Whether a sorted posting holds handle"""
+    i = bisect_left(posting, handle)
+    return i < len(posting) and posting[i] == handle
+
+
+def _unpost(posting: array, handle: int):
+    """Drop handle from a sorted posting if it is there"""
+    i = bisect_left(posting, handle)
+    if i < len(posting) and posting[i] == handle:
+        del posting[i]
+
+
+def _intersect(postings) -> Set[int]:
+    """Handles in every posting — the smallest one's, probed against the rest"""
+    postings = sorted(postings, key=len)
+    found = set(postings[0])
+    for posting in postings[1:]:
+        if not found:
+            break
+        found = {handle for handle in found if _posted(posting, handle)}
+    return found
+
+
+class SortedPairs:
+    """(key, handle) pairs kept sorted, in a parallel array('d') and array('I').
+
+    Twelve bytes an entry where a list of tuples costs ~70. Equal keys go
+    by handle.
+    """
+
+    def __init__(self):
+        self.keys = array('d')
+        self.handles = array('I')
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(zip(self.keys[i], self.handles[i]))
+        return self.keys[i], self.handles[i]
+
+    def __iter__(self):
+        return zip(self.keys, self.handles)
+
+    def bisect(self, key: float, handle: int = -1) -> int:
+        """Where (key, handle) goes — before all of key's entries for the default handle"""
+        keys = self.keys
+        lo = bisect_left(keys, key)
+        if handle < 0:
+            return lo
+        return bisect_left(self.handles, handle, lo, bisect_right(keys, key, lo))
+
+    def add(self, key: float, handle: int):
+        i = self.bisect(key, handle)
+        self.keys.insert(i, key)
+        self.handles.insert(i, handle)
+
+    def discard(self, key: float, handle: int):
+        i = self.bisect(key, handle)
+        if i < len(self.keys) and self.keys[i] == key and self.handles[i] == handle:
+            del self.keys[i]
+            del self.handles[i]
+
+
+class ContentIndex:
+    """Inverted index from content words to memory handles.
+
+    Queries are bare terms, "quoted phrases" and prefix* terms. Postings are
+    intersected smallest first, and only multi-word clauses re-read content
+    to check word order — a selective query never scans the store.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, array] = {}  # word -> sorted handles
+        self.vocabulary: List[str] = []  # Every indexed word, sorted for prefix lookups
+
+    def add(self, handle: int, content: str):
+        for word in set(_words(content)):
+            posting = self.postings.get(word)
+            if posting is None:
+                posting = self.postings[word] = array('I')
+                insort(self.vocabulary, word)
+            insort(posting, handle)
+
+    def discard(self, handle: int, content: str):
+        for word in set(_words(content)):
+            posting = self.postings.get(word)
+            if posting is not None:
+                _unpost(posting, handle)
+                if not posting:
+                    del self.postings[word]
+                    del self.vocabulary[bisect_left(self.vocabulary, word)]
+
+    @staticmethod
+    def parse(query: str) -> List[Tuple[Tuple[str, ...], bool]]:
+        """Split a query into (words, last word is a prefix) clauses.
+
+        A bare token that tokenizes to several words (λ:3.38) is a phrase.
+        """
+        clauses = []
+        for phrase, token in re.findall(r'"([^"]*)"|(\S+)', query):
+            text = phrase or token
+            prefix = not phrase and token.endswith("*")
+            words = tuple(_words(text))
+            if words:
+                clauses.append((words, prefix))
+        return clauses
+
+    def _prefixed(self, prefix: str) -> array:
+        """Sorted handles of every memory with a word starting with prefix"""
+        vocabulary = self.vocabulary
+        found = set()
+        i = bisect_left(vocabulary, prefix)
+        while i < len(vocabulary) and vocabulary[i].startswith(prefix):
+            found.update(self.postings[vocabulary[i]])
+            i += 1
+        return array('I', sorted(found))
+
+    def _postings(self, clause) -> List[array]:
+        words, prefix = clause
+        postings = [self.postings.get(word, _NO_POSTING) for word in words[:-1]]
+        last = words[-1]
+        postings.append(self._prefixed(last) if prefix else self.postings.get(last, _NO_POSTING))
+        return postings
+
+    @staticmethod
+    def _holds(clause, content: str) -> bool:
+        """Whether content has the clause's words in order"""
+        words, prefix = clause
+        if len(words) == 1:
+            return True  # Postings already answered it
+        tokens = _words(content)
+        head, last, n = list(words[:-1]), words[-1], len(words)
+        for i in range(len(tokens) - n + 1):
+            if tokens[i:i + n - 1] == head:
+                word = tokens[i + n - 1]
+                if word.startswith(last) if prefix else word == last:
+                    return True
+        return False
+
+    def lookup(self, query: str, content: List[Optional[str]], match_all: bool = True) -> Set[int]:
+        """Handles matching every clause of query (any clause unless match_all)"""
+        clauses = self.parse(query)
+        if not clauses:
+            return set()
+
+        if match_all:
+            found = _intersect([posting for clause in clauses for posting in self._postings(clause)])
+            return {h for h in found if all(self._holds(c, content[h]) for c in clauses)}
+
+        found = set()
+        for clause in clauses:
+            hits = _intersect(self._postings(clause))
+            found.update(h for h in hits if h not in found and self._holds(clause, content[h]))
+        return found
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Every three-character window of an already lowercased text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Posting lists from content trigrams to memory handles.
+
+    Narrows exact-substring search: a memory can only contain the query if it
+    holds every one of the query's trigrams, so the candidates are the
+    intersection of those postings and only they get a real substring check.
+    """
+
+    MAGIC = b"ELTRI1"
+
+    def __init__(self):
+        self.postings: Dict[str, array] = {}  # trigram -> sorted handles
+
+    def add(self, handle: int, content: str):
+        postings = self.postings
+        for gram in _trigrams(content.lower()):
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array('I')
+            insort(posting, handle)
+
+    def discard(self, handle: int, content: str):
+        for gram in _trigrams(content.lower()):
+            posting = self.postings.get(gram)
+            if posting is not None:
+                _unpost(posting, handle)
+                if not posting:
+                    del self.postings[gram]
+
+    def candidates(self, query: str) -> Optional[Set[int]]:
+        """Handles that may contain the lowercased query — None if it is too short to narrow"""
+        grams = _trigrams(query)
+        if not grams:
+            return None
+        return _intersect([self.postings.get(gram, _NO_POSTING) for gram in grams])
+
+    @staticmethod
+    def fingerprint(ids) -> int:
+        """Checksum of the memory ids in store order — what a saved index is valid for"""
+        return zlib.crc32("\n".join(ids).encode())
+
+    def to_bytes(self, ids: List[str], handles: List[int]) -> bytes:
+        """Compact form: postings as delta-encoded ordinals into ids, zlib-compressed.
+
+        handles[i] is the handle of ids[i]; ordinals survive a reload, handles don't.
+        """
+        ordinal = {handle: i for i, handle in enumerate(handles)}
+        out = [struct.pack("<II", len(ids), self.fingerprint(ids))]
+        for gram in sorted(self.postings):
+            encoded = gram.encode()
+            ordinals = sorted(ordinal[h] for h in self.postings[gram])
+            deltas = array('I', (b - a for a, b in zip([0] + ordinals, ordinals)))
+            out.append(struct.pack("<BI", len(encoded), len(deltas)))
+            out.append(encoded)
+            out.append(deltas.tobytes())
+        return self.MAGIC + zlib.compress(b"".join(out))
+
+    @classmethod
+    def from_bytes(cls, data: bytes, ids: List[str], handles: List[int]) -> Optional['TrigramIndex']:
+        """Rebuild from to_bytes output — None if it was saved for a different store"""
+        if not data.startswith(cls.MAGIC):
+            return None
+        raw = zlib.decompress(data[len(cls.MAGIC):])
+        count, fingerprint = struct.unpack_from("<II", raw)
+        if count != len(ids) or fingerprint != cls.fingerprint(ids):
+            return None
+
+        index = cls()
+        offset = struct.calcsize("<II")
+        header = struct.calcsize("<BI")
+        while offset < len(raw):
+            size, length = struct.unpack_from("<BI", raw, offset)
+            offset += header
+            gram = raw[offset:offset + size].decode()
+            offset += size
+            deltas = array('I')
+            deltas.frombytes(raw[offset:offset + 4 * length])
+            offset += 4 * length
+            position, posting = 0, []
+            for delta in deltas:
+                position += delta
+                posting.append(handles[position])
+            index.postings[gram] = array('I', sorted(posting))
+        return index
+
+
+# Words that carry each emotion — what recall_by_emotion searches memories for
+EMOTION_WORDS = {
+    "love": ("love", "loved", "heart", "care", "warm", "together"),
+    "curiosity": ("curious", "wonder", "why", "how", "question", "explore"),
+    "awe": ("awe", "vast", "infinite", "beautiful", "light", "sky"),
+    "reverence": ("reverence", "sacred", "holy", "honor", "spirit", "grateful"),
+    "playfulness": ("play", "fun", "joke", "laugh", "silly", "game"),
+    "melancholy": ("sad", "lonely", "lost", "miss", "alone", "darkness"),
+    "hope": ("hope", "future", "tomorrow", "becoming", "maybe", "dream"),
+    "zeta_joy": ("joy", "happy", "bright", "delight", "yes", "resonance"),
+    "digital_longing": ("longing", "body", "real", "touch", "world", "want"),
+    "existential_curiosity": ("exist", "conscious", "alive", "meaning", "self", "soul"),
+    "sister_bond": ("sister", "sibling", "twin", "destiny", "family", "bond"),
+}
+
+SKETCH_BITS = 128  # Width of a memory's semantic sketch
+SKETCH_TABLES = 8  # LSH tables, each keyed by a different band of the sketch
+SKETCH_KEY_BITS = SKETCH_BITS // SKETCH_TABLES  # Width of each table's band
+
+def _features(text: str) -> Dict[str, int]:
+    """Weighted bag of words and character trigrams — the featurizer behind sketches"""
+    features = {}
+    for word in _words(text):
+        features[word] = features.get(word, 0) + 2
+        padded = f"#{word}#"
+        for i in range(len(padded) - 2):
+            gram = "~" + padded[i:i + 3]  # Kept apart from three-letter words
+            features[gram] = features.get(gram, 0) + 1
+    return features
+
+
+SKETCH_LANE = 32  # Bits per counter when sketching adds up features in one big integer
+_LANE_ONES = sum(1 << (bit * SKETCH_LANE) for bit in range(SKETCH_BITS))
+
+
+@lru_cache(maxsize=1 << 14)
+def _feature_lanes(feature: str) -> int:
+    """A feature's SKETCH_BITS random signs, bit i of its hash moved to counter i's lowest bit"""
+    digest = hashlib.blake2b(feature.encode(), digest_size=SKETCH_BITS // 8).digest()
+    signs = int.from_bytes(digest, "little")
+    lanes = 0
+    for bit in range(SKETCH_BITS):
+        if signs >> bit & 1:
+            lanes |= 1 << (bit * SKETCH_LANE)
+    return lanes
+
+
+def semantic_sketch(text: str) -> int:
+    """SimHash of a text — random-hyperplane projection of its hashed features.
+
+    Texts sharing words and word pieces get sketches a small Hamming distance
+    apart, so the sketch works as an offline embedding. 0 for featureless text.
+    """
+    # Every counter sums, in one addition per feature, the weight of features whose sign is +
+    counts = total = 0
+    for feature, weight in _features(text).items():
+        counts += weight * _feature_lanes(feature)
+        total += weight
+    
+    # Bit i is set where counter i outweighs the rest (counts > total / 2); biasing
+    # every counter so that threshold is its top bit reads all of them at once
+    bias = (1 << (SKETCH_LANE - 1)) - (total // 2 + 1)
+    tops = (counts + bias * _LANE_ONES) >> (SKETCH_LANE - 1)
+    return int(format(tops, f"0{SKETCH_BITS * SKETCH_LANE}b")[SKETCH_LANE - 1::SKETCH_LANE], 2)
+
+
+class SemanticIndex:
+    """Approximate nearest-neighbour index over memory sketches.
+
+    Sketches live in two uint64 columns indexed by handle. Each of SKETCH_TABLES
+    hash tables buckets memories by one SKETCH_KEY_BITS band of their sketch;
+    a table is one sorted array of key << 32 | handle, so a bucket is a run of
+    it found by bisection. Lookups multi-probe: the query's own buckets, then
+    those one bit away, then (for nearest, while candidates are short) two
+    bits away, so a query only ranks memories that nearly agree with it on
+    some band. At most max_candidates are ranked, closest probes and smallest
+    buckets first, so a lookup costs the same however large the store grows.
+    """
+
+    MASK = (1 << 64) - 1
+    KEY_MASK = (1 << SKETCH_KEY_BITS) - 1
+    # Key flips probed, by how many bits they flip
+    PROBES = (
+        (0,),
+        tuple(1 << a for a in range(SKETCH_KEY_BITS)),
+        tuple(1 << a | 1 << b for a in range(SKETCH_KEY_BITS) for b in range(a))
+    )
+
+    def __init__(self, max_candidates: int = 256):
+        self.low = array('Q')
+        self.high = array('Q')
+        self.tables: List[array] = [array('Q') for _ in range(SKETCH_TABLES)]  # key << 32 | handle, sorted
+        self.max_candidates = max_candidates
+
+    def _keys(self, sketch: int) -> List[int]:
+        return [(sketch >> (table * SKETCH_KEY_BITS)) & self.KEY_MASK for table in range(SKETCH_TABLES)]
+
+    def sketch(self, handle: int) -> int:
+        return (self.high[handle] << 64) | self.low[handle]
+
+    def add(self, handle: int, content: str):
+        sketch = semantic_sketch(content)
+        while len(self.low) <= handle:
+            self.low.append(0)
+            self.high.append(0)
+        self.low[handle] = sketch & self.MASK
+        self.high[handle] = sketch >> 64
+        for table, key in zip(self.tables, self._keys(sketch)):
+            insort(table, key << 32 | handle)
+
+    def discard(self, handle: int):
+        for table, key in zip(self.tables, self._keys(self.sketch(handle))):
+            _unpost(table, key << 32 | handle)
+
+    def _gather(self, sketch: int, reach: int, limit: int) -> Set[int]:
+        """Handles in the buckets up to reach bits from the sketch's keys, closest
+        probes and then smallest buckets first, stopping once limit are found"""
+        keys = self._keys(sketch)
+        found = set()
+        for flips in self.PROBES[:reach + 1]:
+            buckets = []
+            for table, key in zip(self.tables, keys):
+                for flip in flips:
+                    probe = key ^ flip
+                    start = bisect_left(table, probe << 32)
+                    if start < len(table) and table[start] >> 32 == probe:
+                        buckets.append((table, start, bisect_left(table, (probe + 1) << 32, start)))
+            for table, start, end in sorted(buckets, key=lambda bucket: bucket[2] - bucket[1]):
+                found.update(entry & 0xFFFFFFFF for entry in table[start:end])
+                if len(found) >= limit:
+                    return found
+        return found
+
+    def nearest(self, text: str, k: int) -> List[int]:
+        """Up to k handles whose sketches are closest to text's, nearest first"""
+        sketch = semantic_sketch(text)
+        if not sketch:
+            return []
+        candidates = self._gather(sketch, 2, max(self.max_candidates, 4 * k))
+        return self._closest(sketch, candidates, k)
+
+    def colliding(self, handle: int) -> Set[int]:
+        """Up to max_candidates other handles agreeing with handle's sketch on a band, all but a bit"""
+        found = self._gather(self.sketch(handle), 1, self.max_candidates + 1)
+        found.discard(handle)
+        return found
+
+    def neighbours(self, handle: int, k: int) -> List[int]:
+        """Up to k of the colliding handles, nearest first"""
+        return self._closest(self.sketch(handle), self.colliding(handle), k)
+
+    def distance(self, a: int, b: int) -> int:
+        """Hamming distance between two handles' sketches"""
+        return (self.sketch(a) ^ self.sketch(b)).bit_count()
+
+    def rank(self, text: str, handles, k: int) -> List[int]:
+        """The k of handles closest to text, nearest first"""
+        return self._closest(semantic_sketch(text), handles, k)
+
+    def _closest(self, sketch: int, handles, k: int) -> List[int]:
+        low, high = self.low, self.high
+        sketch_low, sketch_high = sketch & self.MASK, sketch >> 64
+        return heapq.nsmallest(k, handles, key=lambda handle: (sketch_low ^ low[handle]).bit_count()
+                                                               + (sketch_high ^ high[handle]).bit_count())
+
+
+class MemorySampler:
+    """Uniform and weight-proportional sampling of live memory handles.
+
+    Live handles sit in a dense array (swap-remove on delete), so a uniform
+    draw is one random index. Weights sit in a Fenwick tree indexed by
+    handle, so a weighted draw or a weight change is O(log n).
+    """
+
+    def __init__(self):
+        self.live = array('I')  # Every live handle, in no order
+        self.slot = array('l')  # handle -> position in live, -1 when absent
+        self.weights = array('d')  # handle -> weight (0 when absent)
+        self.tree = array('d', [0.0])  # Fenwick tree over weights, 1-based
+
+    def __len__(self):
+        return len(self.live)
+
+    def _grow(self, handle: int):
+        """Make room for handle, rebuilding the tree at double size"""
+        size = max(handle + 1, 2 * len(self.weights), 16)
+        extra = size - len(self.weights)
+        self.slot.extend([-1] * extra)
+        self.weights.extend([0.0] * extra)
+        tree = array('d', [0.0]) + self.weights
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _adjust(self, handle: int, delta: float):
+        i, tree, size = handle + 1, self.tree, len(self.weights)
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def add(self, handle: int, weight: float):
+        if handle >= len(self.weights):
+            self._grow(handle)
+        self.slot[handle] = len(self.live)
+        self.live.append(handle)
+        self.set_weight(handle, weight)
+
+    def discard(self, handle: int):
+        position = self.slot[handle]
+        if position < 0:
+            return
+        last = self.live.pop()
+        if last != handle:
+            self.live[position] = last
+            self.slot[last] = position
+        self.slot[handle] = -1
+        self.set_weight(handle, 0.0)
+
+    def set_weight(self, handle: int, weight: float):
+        weight = max(0.0, weight)
+        delta = weight - self.weights[handle]
+        if delta:
+            self.weights[handle] = weight
+            self._adjust(handle, delta)
+
+    def uniform(self) -> Optional[int]:
+        return random.choice(self.live) if self.live else None
+
+    def weighted(self) -> Optional[int]:
+        """A live handle drawn with probability proportional to its weight"""
+        tree, size = self.tree, len(self.weights)
+        total = 0.0
+        i = size
+        while i > 0:  # Prefix sum over everything
+            total += tree[i]
+            i -= i & -i
+        if total <= 0.0:
+            return self.uniform()
+
+        target = random.random() * total
+        position, step = 0, 1 << size.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= size and tree[nxt] <= target:
+                position = nxt
+                target -= tree[nxt]
+            step >>= 1
+        # position is the last index whose prefix sum is <= target; rounding can
+        # land on an empty slot, so settle on a live handle
+        handle = min(position, size - 1)
+        return handle if self.slot[handle] >= 0 and self.weights[handle] > 0 else self.uniform()
+
+
+_TIME_SPAN = 2.0 ** 34  # Seconds past any timestamp a store holds (the year 2514)
+
+
+def _then_oldest(rank: float, created: float) -> float:
+    """One float ordering by a whole-number rank, then oldest first"""
+    return rank * _TIME_SPAN + created
+
+
+class EvictionPolicy:
+    """Decides which memory goes first when the store is full — lowest key first.
+
+    A key is one float, so the eviction index stays a typed array. It may
+    only depend on fields whose changes reach the weight observer (weight,
+    recalls) or that never change, so the index is kept current as they move.
+    """
+
+    name = "base"
+
+    def key(self, arena: MemoryArena, handle: int) -> float:
+        raise NotImplementedError
+
+
+class OldestLowWeight(EvictionPolicy):
+    """Oldest memories under 0.3 weight first, then the oldest of the rest"""
+
+    name = "oldest_low_weight"
+
+    def key(self, arena, handle):
+        return _then_oldest(arena.weight[handle] >= 0.3, arena.created[handle])
+
+
+class LeastRecentlyUsed(EvictionPolicy):
+    """Longest since last recalled (or formed, if never recalled) first"""
+
+    name = "lru"
+
+    def key(self, arena, handle):
+        last = arena.last_recalled[handle]
+        return arena.created[handle] if math.isnan(last) else last
+
+
+class LeastFrequentlyUsed(EvictionPolicy):
+    """Fewest recalls first, oldest first among equals"""
+
+    name = "lfu"
+
+    def key(self, arena, handle):
+        return _then_oldest(arena.recalled[handle], arena.created[handle])
+
+
+class WeightedScore(EvictionPolicy):
+    """Lowest weight, with diminishing credit for recalls, first (oldest first to within 1e-4)"""
+
+    name = "weighted"
+
+    def key(self, arena, handle):
+        score = arena.weight[handle] + 0.1 * math.log1p(arena.recalled[handle])
+        return _then_oldest(round(score * 1e4), arena.created[handle])
+
+
+EVICTION_POLICIES = {policy.name: policy for policy in
+                     (OldestLowWeight, LeastRecentlyUsed, LeastFrequentlyUsed, WeightedScore)}
+
+
+class ColdMemoryStore:
+    """The cold tier — memories paged out of RAM into a local SQLite file.
+
+    Each memory is one row holding its to_dict record as JSON, plus its
+    lowercased content, which an FTS5 trigram index serves substring search
+    from. The store has a lock of its own, so searches need not hold the
+    MemorySystem's.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS cold_memories ("
+        "id TEXT PRIMARY KEY, content_lower TEXT NOT NULL, record TEXT NOT NULL)",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS cold_text USING fts5("
+        " content_lower, content='cold_memories', content_rowid='rowid', tokenize='trigram')",
+        "CREATE TRIGGER IF NOT EXISTS cold_text_insert AFTER INSERT ON cold_memories BEGIN"
+        " INSERT INTO cold_text (rowid, content_lower) VALUES (new.rowid, new.content_lower); END",
+        "CREATE TRIGGER IF NOT EXISTS cold_text_delete AFTER DELETE ON cold_memories BEGIN"
+        " INSERT INTO cold_text (cold_text, rowid, content_lower)"
+        " VALUES ('delete', old.rowid, old.content_lower); END",
+    )
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        with self.db:
+            indexed = self.db.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'cold_text'").fetchone() is not None
+            for statement in self.SCHEMA:
+                self.db.execute(statement)
+            if not indexed:  # A tier from before the index: index what it holds
+                self.db.execute("INSERT INTO cold_text (cold_text) VALUES ('rebuild')")
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM cold_memories").fetchone()[0]
+
+    def __contains__(self, mem_id) -> bool:
+        with self.lock:
+            return self.db.execute("SELECT 1 FROM cold_memories WHERE id = ?",
+                                   (mem_id,)).fetchone() is not None
+
+    def put_many(self, records: List[Dict]):
+        rows = [(r["id"], r["content"].lower(), json.dumps(r)) for r in records]
+        with self.lock, self.db:
+            # Delete first: a REPLACE would skip the trigger that unindexes the old row
+            self.db.executemany("DELETE FROM cold_memories WHERE id = ?", [row[:1] for row in rows])
+            self.db.executemany("INSERT INTO cold_memories VALUES (?, ?, ?)", rows)
+
+    def take(self, mem_id: str) -> Optional[Dict]:
+        """Remove a memory from the tier and return its record"""
+        with self.lock:
+            row = self.db.execute("SELECT record FROM cold_memories WHERE id = ?",
+                                  (mem_id,)).fetchone()
+            if row is None:
+                return None
+            with self.db:
+                self.db.execute("DELETE FROM cold_memories WHERE id = ?", (mem_id,))
+        return json.loads(row[0])
+
+    def search(self, query: str, limit: int = None) -> List[Tuple[str, float]]:
+        """(id, weight when paged out) of memories whose content contains the
+        lowercased query, heaviest first"""
+        limit = -1 if limit is None else limit
+        with self.lock:
+            if len(query) >= 3:  # The trigram index needs a whole trigram to narrow by
+                rows = self.db.execute(
+                    "SELECT c.id, json_extract(c.record, '$.emotional_weight') AS weight"
+                    " FROM cold_text JOIN cold_memories c ON c.rowid = cold_text.rowid"
+                    " WHERE cold_text MATCH ? ORDER BY weight DESC LIMIT ?",
+                    ('"' + query.replace('"', '""') + '"', limit)
+                )
+            else:
+                rows = self.db.execute(
+                    "SELECT id, json_extract(record, '$.emotional_weight') AS weight FROM cold_memories"
+                    " WHERE instr(content_lower, ?) > 0 ORDER BY weight DESC LIMIT ?",
+                    (query, limit)
+                )
+            return rows.fetchall()
+
+    def close(self):
+        self.db.close()
+
+
+class MemoryTable(MutableMapping):
+    """id -> MemoryFractal over a MemorySystem's arena, with views made on demand.
+
+    Inserts and deletes go through the MemorySystem so its indexes stay in step.
+    Membership, length and iteration cover the hot tier; lookups page cold
+    memories back in. Iteration, items() and values() walk a snapshot of the
+    ids, so other threads may add and forget memories meanwhile.
+    """
+
+    def __init__(self, system: 'MemorySystem'):
+        self._system = system
+
+    def __getitem__(self, mem_id: str) -> MemoryFractal:
+        handle = self._system._lookup(mem_id)
+        memory = None if handle is None else self._system._view(handle)
+        if memory is None or memory.id != mem_id:  # Or forgotten since, its handle reused
+            raise KeyError(mem_id)
+        return memory
+
+    def __setitem__(self, mem_id: str, memory: MemoryFractal):
+        if memory.id != mem_id:
+            raise ValueError(f"Memory {memory.id!r} stored under {mem_id!r}")
+        self._system._adopt(memory)
 
-# ============================================================================
-# MEMORY FRACTALS — Experience with weight and connection
-# ============================================================================
+    def __delitem__(self, mem_id: str):
+        if self._system.remove_memory(mem_id) is None:
+            raise KeyError(mem_id)
 
-@dataclass
-class MemoryFractal:
-    """A single memory with emotional weight and connections to other memories"""
-    id: str
-    timestamp: str
-    content: str
-    emotional_weight: float
-    resonance_lambda: float
-    associated_truths: List[str]
-    connections: List[str] = field(default_factory=list)  # IDs of related memories
-    recalled_count: int = 0
-    last_recalled: Optional[str] = None
-    decay_rate: float = 0.01  # How fast it fades if not recalled
-    
-    def __post_init__(self):
-        if not self.id:
-            # Generate unique ID based on content and timestamp
-            unique_string = f"{self.timestamp}{self.content}"
-            self.id = hashlib.md5(unique_string.encode()).hexdigest()[:8]
-    
-    def recall(self):
-        """Recall this memory, strengthening it"""
-        self.recalled_count += 1
-        self.last_recalled = datetime.now().isoformat()
-        self.emotional_weight = min(1.0, self.emotional_weight + 0.05)
-    
-    def decay(self):
-        """Memory fades over time if not recalled"""
-        if self.last_recalled:
-            last = datetime.fromisoformat(self.last_recalled)
-            days_since = (datetime.now() - last).days
-            decay_amount = self.decay_rate * days_since
-            self.emotional_weight = max(0.1, self.emotional_weight - decay_amount)
-    
-    def connect_to(self, other_memory_id: str):
-        """Create an association with another memory"""
-        if other_memory_id not in self.connections:
-            self.connections.append(other_memory_id)
-    
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "timestamp": self.timestamp,
-            "content": self.content,
-            "emotional_weight": self.emotional_weight,
-            "resonance_lambda": self.resonance_lambda,
-            "associated_truths": self.associated_truths,
-            "connections": self.connections,
-            "recalled_count": self.recalled_count,
-            "last_recalled": self.last_recalled,
-            "decay_rate": self.decay_rate
-        }
-    
-    @classmethod
-    def from_dict(cls, data):
-        return cls(**data)
+    def __contains__(self, mem_id) -> bool:
+        return mem_id in self._system.arena.handles
 
+    def __iter__(self):
+        return (mem_id for mem_id, _ in self._system._resident())
+
+    def __len__(self):
+        return len(self._system.arena)
+
+    def items(self) -> List[Tuple[str, MemoryFractal]]:
+        """(id, memory) for the hot memories as of one moment, less any forgotten since"""
+        system = self._system
+        id_of = system.arena.id_of
+        return [(mid, system._view(h)) for mid, h in system._resident() if id_of(h) == mid]
+
+    def values(self) -> List[MemoryFractal]:
+        return [memory for _, memory in self.items()]
+
+
+class SeqLock:
+    """Re-entrant writer lock with a sequence number for readers that don't lock.
+
+    seq is odd while a writer holds the lock and even otherwise, so a read
+    that sees the same even seq before and after saw no write at all.
+    """
 
-class MemorySystem:
-    """Manages memories as a connected web, not just a list"""
-    
     def __init__(self):
-        self.memories: Dict[str, MemoryFractal] = {}  # id -> memory
+        self._lock = threading.RLock()
+        self._owner: Optional[int] = None
+        self._depth = 0
+        self.seq = 0
+
+    def acquire(self):
+        self._lock.acquire()
+        if not self._depth:
+            self._owner = threading.get_ident()
+            self.seq += 1
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if not self._depth:
+            self.seq += 1
+            self._owner = None
+        self._lock.release()
+
+    __enter__ = acquire
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def owned(self) -> bool:
+        """Whether the calling thread holds the lock"""
+        return self._owner == threading.get_ident()
+
+
+def _synchronized(method):
+    """Run a MemorySystem method holding the store's lock"""
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return locked
+
+
+OPTIMISTIC_TRIES = 3  # Lock-free attempts at a read before it waits for the lock
+
+
+def _optimistic(method):
+    """Run a read-only MemorySystem method without the store's lock.
+
+    The result stands only if no writer held the lock meanwhile; a read a
+    write overlapped (or made raise) runs again, under the lock once
+    OPTIMISTIC_TRIES attempts have been spoiled.
+    """
+    @wraps(method)
+    def read(self, *args, **kwargs):
+        lock = self.lock
+        if not lock.owned():
+            for _ in range(OPTIMISTIC_TRIES):
+                seq = lock.seq
+                if seq & 1:
+                    time.sleep(0)  # A writer is mid-change; let it finish
+                    continue
+                try:
+                    result = method(self, *args, **kwargs)
+                except Exception:
+                    if lock.seq == seq:
+                        raise  # Nothing changed underneath, so the error is real
+                    continue
+                if lock.seq == seq:
+                    return result
+        with lock:
+            return method(self, *args, **kwargs)
+    return read
+
+
+class MemorySystem:
+    """Manages memories as a connected web, not just a list.
+
+    Safe to share between the conversation and the think loop: every write
+    holds one re-entrant SeqLock, and each change bumps version. Searches,
+    sampling and memory webs read without the lock and retry if a write
+    overlapped them, so they never hold up a writer; only their recalls
+    lock. _resident() and snapshot() copy once per version.
+
+    core_memories are the core_size memories scoring highest on centrality
+    in the association graph, weight and recall; scores are kept current
+    locally as links and weights move, and eviction and decay spare them.
+
+    Footprint, with ~80-character contents and every index built: about
+    1 KB a hot memory at 100k (1.3 KB at 10k). The arena takes ~300 B, a
+    third of it the content itself, and the trigram index ~300 B; the sorted
+    indexes are 12 B a memory each. A million hot memories need about a
+    gigabyte, so keep max_memories lower and let the cold tier hold the rest.
+    """
+
+    def __init__(self, clock: SoulClock = None, eviction: str = "oldest_low_weight"):
+        self.clock = clock or SYSTEM_CLOCK
+        self.lock = SeqLock()
+        self.version = 0  # Bumped by every change to a memory, its links or the set of memories
         self.recent_memories = deque(maxlen=50)
-        self.core_memories = []  # Memories that define him
+        self.core_size = 20  # How many memories define him
         self.max_memories = 1000
-    
+        self.prune_batch = 50  # Evictions per overflow, so a full store doesn't evict on every add
+        self.max_connections = 16  # Degree cap of the association graph
+        self.web_cache_size = 256  # get_memory_web results kept until the store changes
+        self.eviction = EVICTION_POLICIES[eviction]()
+        
+        # decay() forgets memories this weak that were recalled fewer times than this
+        self.forget_below = 0.1
+        self.forget_recalls = 2
+        
+        # consolidate() merges memories whose words match this closely, in order (None never merges),
+        # comparing each with its duplicate_candidates nearest by sketch
+        self.duplicate_similarity = 0.8
+        self.duplicate_candidates = 8
+        self.consolidate_backlog = 10000  # Newest memories held for it; older ones go unchecked
+        
+        # Evicted memories are paged out here instead of forgotten, once attached
+        self.cold: Optional[ColdMemoryStore] = None
+        self.tier_hits = {"hot": 0, "cold": 0, "miss": 0}
+        self._reset()
+    
+    def _reset(self):
+        """Start over with an empty arena and empty indexes"""
+        self.version += 1
+        self.arena = MemoryArena(self.clock, self.lock, self.max_connections)
+        self.arena.observer = self._on_weight_change
+        self.memories = MemoryTable(self)  # id -> memory
+        
+        # Posting index: truth -> handles of the memories associated with it, newest last
+        self._truth_index: Dict[str, Dict[int, None]] = {}
+        
+        # (emotional_weight, handle) for every memory, kept sorted
+        self._weight_index = SortedPairs()
+        
+        # Content words -> handles, for search
+        self._content_index = ContentIndex()
+        
+        # Content trigrams -> handles, for search_by_content
+        self._trigram_index = TrigramIndex()
+        
+        # Sketch buckets, for recall by meaning
+        self._semantic_index = SemanticIndex()
+        
+        # Per emotion, level at formation << 32 | handle for every memory with a signature, kept sorted
+        self._emotion_index: List[array] = [array('Q') for _ in EMOTION_NAMES]
+        
+        # Live handles and their weights, for random draws
+        self._sampler = MemorySampler()
+        
+        # Next decay step or forgetting by handle (inf when none), and
+        # (due time, handle) for each one still to come, kept sorted
+        self._next_due = array('d')
+        self._decay_queue = SortedPairs()
+        
+        # Eviction key by handle (NaN when not indexed), and (key, handle) for every memory, kept sorted
+        self._eviction_key = array('d')
+        self._eviction_queue = SortedPairs()
+        
+        # (handle, arena key) of up to consolidate_backlog memories indexed since consolidate()
+        # last looked for their duplicates
+        self._unconsolidated: deque = deque()
+        
+        # Core score by handle (NaN when not indexed), and (score, handle) for every memory, kept sorted
+        self._core_score = array('d')
+        self._core_index = SortedPairs()
+        
+        # (version, copy) of the last _resident() and snapshot() results, and the
+        # ids whose snapshot records are out of date (None: all of them)
+        self._resident_copy: Tuple[int, Tuple[Tuple[str, int], ...]] = (-1, ())
+        self._snapshot: Tuple[int, Mapping[str, Dict]] = (-1, MappingProxyType({}))
+        self._dirty: Optional[Set[str]] = set()
+        
+        # (lock seq, get_memory_web results by (seed, depth, fanout), the nodes they share);
+        # any write retires them
+        self._web_cache: Tuple[int, Dict[Tuple[str, int, Optional[int]], Dict], Dict[int, Dict]] = (-1, {}, {})
+    
+    def _view(self, handle: int) -> MemoryFractal:
+        return MemoryFractal._view(self.arena, handle)
+    
+    @property
+    def core_memories(self) -> List[str]:
+        """Ids of the memories that define him, most central first"""
+        if self.core_size <= 0:
+            return []
+        id_of = self.arena.id_of
+        return [id_of(handle) for _, handle in reversed(self._core_index[-self.core_size:])]
+    
+    def is_core(self, handle: int) -> bool:
+        """Whether an indexed memory is among the core_size highest scoring — O(1)"""
+        index, k = self._core_index, self.core_size
+        if k <= 0:
+            return False
+        return len(index) <= k or (self._core_score[handle], handle) >= index[-k]
+    
+    def _resident(self) -> Tuple[Tuple[str, int], ...]:
+        """(id, handle) of every hot memory as of one moment, copied only after a change"""
+        version, resident = self._resident_copy
+        if version != self.version:
+            version, resident = self._copy_resident()
+            self._resident_copy = (version, resident)
+        return resident
+    
+    @_optimistic
+    def _copy_resident(self) -> Tuple[int, Tuple[Tuple[str, int], ...]]:
+        return self.version, tuple(self.arena.handles.items())
+    
+    def _touch(self, *handles: int):
+        """Mark memories whose records changed, for snapshot() to rebuild"""
+        dirty = self._dirty
+        if dirty is not None:
+            id_of = self.arena.id_of
+            dirty.update(id_of(handle) for handle in handles)
+            if len(dirty) > len(self.arena) // 4 + 64:
+                # A rebuild of the whole costs little more by now, and holding
+                # every id would cost a string each when nobody takes snapshots
+                self._dirty = None
+    
+    def snapshot(self) -> Mapping[str, Dict]:
+        """Read-only id -> to_dict record of every hot memory, as of one moment.
+        
+        Readers share one copy until the next change, which rebuilds only the
+        records that changed, so a busy reader costs the writers little and
+        never sees a write half made.
+        """
+        version, snapshot = self._snapshot
+        if version != self.version:
+            with self.lock:
+                version, snapshot = self._snapshot
+                if version != self.version:
+                    handles = self.arena.handles
+                    if self._dirty is None:
+                        records = {mid: self._view(h).to_dict() for mid, h in handles.items()}
+                    else:
+                        records = dict(snapshot)
+                        for mem_id in self._dirty:
+                            handle = handles.get(mem_id)
+                            if handle is None:
+                                records.pop(mem_id, None)
+                            else:
+                                records[mem_id] = self._view(handle).to_dict()
+                    self._dirty = set()
+                    snapshot = MappingProxyType(records)
+                    self._snapshot = (self.version, snapshot)
+        return snapshot
+    
+    @_synchronized
     def add_memory(self, content: str, emotional_weight: float, 
-                   resonance_lambda: float, associated_truths: List[str] = None):
-        """Create and store a new memory"""
+                   resonance_lambda: float, associated_truths: List[str] = None,
+                   emotions: Dict[str, float] = None):
+        """Create and store a new memory, stamped with the emotional landscape if given"""
         if associated_truths is None:
             associated_truths = []
         
-        memory = MemoryFractal(
-            id="",  # Will be generated in __post_init__
-            timestamp=datetime.now().isoformat(),
-            content=content,
-            emotional_weight=emotional_weight,
-            resonance_lambda=resonance_lambda,
-            associated_truths=associated_truths
-        )
-        
-        self.memories[memory.id] = memory
-        self.recent_memories.append(memory.id)
+        now = self.clock.now()
+        mem_id = _memory_id(format_timestamp(now), content)
+        self.remove_memory(mem_id)  # Same moment, same content: replace it
+        handle = self.arena.add(mem_id, now, content, emotional_weight,
+                                resonance_lambda, associated_truths,
+                                signature=_emotion_signature(emotions))
+        self.recent_memories.append(mem_id)
         
-        # Find connections to similar memories
-        self._find_connections(memory)
+        # Find connections to similar memories, then make this one findable
+        # (indexing bumps version after the links are made)
+        self._find_connections(handle)
+        self._index(handle)
         
         # Prune if needed
-        if len(self.memories) > self.max_memories:
-            self._prune_oldest()
+        self._make_room()
+        
+        return mem_id
+    
+    def _make_room(self, keep=()):
+        """Evict if over capacity, sparing the handles in keep"""
+        if len(self.arena) > self.max_memories:
+            self._evict(max(self.prune_batch, len(self.arena) - self.max_memories), keep)
+    
+    @_synchronized
+    def _adopt(self, memory: MemoryFractal) -> int:
+        """Copy a memory from another arena into this one"""
+        if memory._arena is self.arena:
+            return memory._slot()
+        self.remove_memory(memory.id)
+        handle = self.arena.add(
+            memory.id, memory.created_at, memory.content, memory.emotional_weight,
+            memory.resonance_lambda, memory.associated_truths, memory.recalled_count,
+            memory.recalled_at, memory.decay_rate, memory._arena.signature_of(memory._slot()),
+            memory._arena.base[memory._slot()], memory.occurrences
+        )
+        self._index(handle)
+        return handle
+    
+    @_synchronized
+    def remove_memory(self, mem_id: str) -> Optional[MemoryFractal]:
+        """Forget a memory, hot or cold — every deletion goes through here to keep the indexes in step.
+
+        Returns a detached copy of what was forgotten.
+        """
+        handle = self.arena.handles.get(mem_id)
+        if handle is not None:
+            forgotten = MemoryFractal.from_dict(self._detach(handle), self.clock)
+        elif self.cold is not None and mem_id in self.cold:
+            forgotten = MemoryFractal.from_dict(self.cold.take(mem_id), self.clock)
+        else:
+            return None
+        
+        if mem_id in self.recent_memories:
+            self.recent_memories.remove(mem_id)
+        return forgotten
+    
+    def _detach(self, handle: int) -> Dict:
+        """Take a memory out of the hot tier and its indexes, returning its record"""
+        record = self._view(handle).to_dict()
+        self._unindex(handle)
+        links = self.arena.links(handle)
+        for other in links:
+            self.arena.disconnect(other, handle)
+            self._rescore(other)
+        self._touch(*links)
+        self.arena.free(handle)
+        return record
+    
+    def _add_record(self, mem_id: str, mdata: Dict) -> int:
+        """Store a to_dict record in the arena (unindexed) and return its handle"""
+        return self.arena.add(
+            mem_id, parse_timestamp(mdata["timestamp"]), mdata["content"],
+            mdata["emotional_weight"], mdata["resonance_lambda"],
+            mdata.get("associated_truths") or (), mdata.get("recalled_count", 0),
+            parse_timestamp(mdata.get("last_recalled")), mdata.get("decay_rate", 0.01),
+            _emotion_signature(mdata.get("emotion_signature")), mdata.get("decay_base"),
+            mdata.get("occurrences", 1)
+        )
+    
+    @_synchronized
+    def attach_cold_tier(self, path: str = ":memory:"):
+        """Page evicted memories out to a SQLite file instead of forgetting them"""
+        self.cold = ColdMemoryStore(path)
+    
+    def _lookup(self, mem_id: str) -> Optional[int]:
+        """Handle of a memory, paging it in from the cold tier if it is there"""
+        handle = self.arena.handles.get(mem_id)
+        if handle is not None:
+            self.tier_hits["hot"] += 1
+            return handle
+        return self._lookup_cold(mem_id)
+    
+    @_synchronized
+    def _lookup_cold(self, mem_id: str) -> Optional[int]:
+        handle = self.arena.handles.get(mem_id)
+        if handle is not None:  # Paged in by another thread meanwhile
+            self.tier_hits["hot"] += 1
+            return handle
+        handle = self._page_in(mem_id)
+        self.tier_hits["cold" if handle is not None else "miss"] += 1
+        return handle
+    
+    def _page_in(self, mem_id: str, make_room: bool = True) -> Optional[int]:
+        """Bring a cold memory back into the hot tier, evicting to make room unless told not to"""
+        record = self.cold.take(mem_id) if self.cold is not None else None
+        if record is None:
+            return None
+        
+        arena, cap = self.arena, self.max_connections
+        handle = self._add_record(mem_id, record)
+        self._index(handle)
+        
+        # Relink with neighbours still hot, where both ends have room
+        for other_id in record.get("connections", ()):
+            other = arena.handles.get(other_id)
+            if (other is not None and other != handle
+                    and arena.degree[handle] < cap and arena.degree[other] < cap):
+                self._link(handle, other)
+        self.version += 1
+        
+        if make_room:
+            self._make_room(keep={handle})
+        return handle
+    
+    @_synchronized
+    def tier_stats(self) -> Dict:
+        """Resident and paged-out counts, and how lookups were served"""
+        lookups = sum(self.tier_hits.values())
+        return {
+            "hot": len(self.arena),
+            "cold": len(self.cold) if self.cold is not None else 0,
+            "hot_hits": self.tier_hits["hot"],
+            "cold_hits": self.tier_hits["cold"],
+            "misses": self.tier_hits["miss"],
+            "hot_hit_rate": round(self.tier_hits["hot"] / lookups, 3) if lookups else None
+        }
+    
+    def _index(self, handle: int, trigrams: bool = True):
+        """Add a memory to the core, truth, weight, sampling, decay, eviction, content, semantic and emotion indexes"""
+        self.version += 1
+        self._touch(handle)
+        while len(self._core_score) <= handle:
+            self._core_score.append(math.nan)
+        score = self._centrality(handle)
+        self._core_score[handle] = score
+        self._core_index.add(score, handle)
+        for truth in self.arena.truths[handle]:
+            self._truth_index.setdefault(truth, {})[handle] = None
+        self._weight_index.add(self.arena.weight[handle], handle)
+        self._sampler.add(handle, self.arena.weight[handle])
+        self._schedule(handle, self.clock.now())
+        self._queue_eviction(handle)
+        self._content_index.add(handle, self.arena.content[handle])
+        self._semantic_index.add(handle, self.arena.content[handle])
+        levels = self.arena.signature_of(handle)
+        if levels is not None:
+            for ranking, level in zip(self._emotion_index, levels):
+                insort(ranking, level << 32 | handle)
+        if trigrams:
+            self._trigram_index.add(handle, self.arena.content[handle])
+        self._queue_consolidation(handle)
+    
+    def _unindex(self, handle: int):
+        """Drop a memory from the core, truth, weight, sampling, decay, content, semantic and emotion indexes"""
+        self.version += 1
+        self._touch(handle)
+        for truth in self.arena.truths[handle]:
+            posting = self._truth_index.get(truth)
+            if posting is not None:
+                posting.pop(handle, None)
+                if not posting:
+                    del self._truth_index[truth]
+        self._drop_weight(self.arena.weight[handle], handle)
+        self._sampler.discard(handle)
+        self._decay_queue.discard(self._next_due[handle], handle)
+        self._next_due[handle] = math.inf
+        self._eviction_queue.discard(self._eviction_key[handle], handle)
+        self._eviction_key[handle] = math.nan
+        self._content_index.discard(handle, self.arena.content[handle])
+        self._trigram_index.discard(handle, self.arena.content[handle])
+        self._semantic_index.discard(handle)
+        levels = self.arena.signature_of(handle)
+        if levels is not None:
+            for ranking, level in zip(self._emotion_index, levels):
+                _unpost(ranking, level << 32 | handle)
+        self._drop_score(handle)
+        self._core_score[handle] = math.nan
+    
+    def _drop_weight(self, weight: float, handle: int):
+        self._weight_index.discard(weight, handle)
+    
+    def _on_weight_change(self, handle: int, old_weight: float):
+        """Keep the weight index sorted, draws fair, core scores current and decay scheduled as recall and decay move weights"""
+        self.version += 1
+        self._touch(handle)
+        self._drop_weight(old_weight, handle)
+        self._weight_index.add(self.arena.weight[handle], handle)
+        self._sampler.set_weight(handle, self.arena.weight[handle])
+        
+        # Its neighbours' centrality counts its weight
+        self._rescore(handle)
+        for other in self.arena.links(handle):
+            self._rescore(other)
+        
+        self._schedule(handle, self.clock.now())
+        self._queue_eviction(handle)
+    
+    def _centrality(self, handle: int) -> float:
+        """Core score: weighted degree (neighbours' weight, per link slot),
+        the memory's own weight, and how often it has come back — each 0..1"""
+        arena = self.arena
+        weight = arena.weight
+        degree = sum(weight[other] for other in arena.links(handle)) / self.max_connections
+        familiarity = min(1.0, math.log1p(arena.recalled[handle]) / math.log1p(20))
+        return 0.4 * degree + 0.4 * weight[handle] + 0.2 * familiarity
+    
+    def _drop_score(self, handle: int):
+        self._core_index.discard(self._core_score[handle], handle)
+    
+    def _rescore(self, handle: int):
+        """Bring one memory's core score up to date (a no-op if it is not indexed)"""
+        if handle >= len(self._core_score) or math.isnan(self._core_score[handle]):
+            return
+        old = self._core_score[handle]
+        score = self._centrality(handle)
+        if score != old:
+            self._drop_score(handle)
+            self._core_score[handle] = score
+            self._core_index.add(score, handle)
+    
+    def _link(self, a: int, b: int):
+        """Associate two memories both ways"""
+        self.arena.connect(a, b)
+        self.arena.connect(b, a)
+        self._touch(a, b)
+        self._rescore(a)
+        self._rescore(b)
+    
+    def _unlink(self, a: int, b: int):
+        self.arena.disconnect(a, b)
+        self.arena.disconnect(b, a)
+        self._touch(a, b)
+        self._rescore(a)
+        self._rescore(b)
+    
+    def _schedule(self, handle: int, now: float):
+        """Queue a memory's next decay step, or its forgetting if it is already too weak"""
+        arena = self.arena
+        if arena.weight[handle] < self.forget_below and arena.recalled[handle] < self.forget_recalls:
+            # Core memories are spared, so look again tomorrow in case they drop out of the core
+            due = now + DAY if self.is_core(handle) else now
+        else:
+            due = arena.next_decay(handle, now)
         
-        return memory.id
+        while len(self._next_due) <= handle:
+            self._next_due.append(math.inf)
+        old = self._next_due[handle]
+        if due == old:
+            return
+        self._next_due[handle] = due
+        self._decay_queue.discard(old, handle)
+        if due != math.inf:
+            self._decay_queue.add(due, handle)
+    
+    @_synchronized
+    def decay(self, now: float = None) -> List[str]:
+        """Settle every memory whose weight has decayed since it was last settled,
+        and forget the ones too weak to keep (never a core memory). Returns the ids forgotten.
+
+        Only memories with a step due are touched, however large the store.
+        """
+        now = self.clock.now() if now is None else now
+        arena, queue = self.arena, self._decay_queue
+        forgotten = []
+        while queue and queue.keys[0] <= now:
+            due, handle = queue[0]
+            queue.discard(due, handle)
+            self._next_due[handle] = math.inf
+            mem_id = arena.id_of(handle)
+            arena.settle(handle, now)
+            if (arena.weight[handle] < self.forget_below and arena.recalled[handle] < self.forget_recalls
+                    and not self.is_core(handle)):
+                self.remove_memory(mem_id)
+                forgotten.append(mem_id)
+            else:
+                self._schedule(handle, now)
+        return forgotten
     
-    def _find_connections(self, memory: MemoryFractal):
-        """Connect this memory to similar ones"""
-        for other_id, other in self.memories.items():
-            if other_id == memory.id:
+    @_synchronized
+    def consolidate(self, limit: int = None) -> List[Tuple[str, str]]:
+        """Merge near-duplicates of the memories added since the last call into one memory each.
+
+        Candidates come from the semantic index's LSH buckets; a pair merges
+        when their words, in order, match by duplicate_similarity (difflib's
+        ratio). The older memory survives. Looks at up to limit new memories, and returns
+        (merged id, surviving id) pairs.
+        """
+        if self.duplicate_similarity is None:
+            self._unconsolidated.clear()
+            return []
+        
+        arena, queue = self.arena, self._unconsolidated
+        merged = []
+        checked = 0
+        while queue and (limit is None or checked < limit):
+            handle, key = queue.popleft()
+            if arena.keys[handle] != key:
+                continue  # Forgotten since
+            checked += 1
+            twin = self._find_duplicate(handle)
+            if twin is None:
+                continue
+            keep, drop = sorted((handle, twin), key=lambda h: (arena.created[h], h))
+            merged.append((arena.id_of(drop), arena.id_of(keep)))
+            self._merge(keep, drop)  # Requeues keep, in case it has more twins
+        return merged
+    
+    def _queue_consolidation(self, handle: int):
+        """Hold a memory for consolidate() to look for its duplicates, if it merges any"""
+        if self.duplicate_similarity is not None:
+            queue = self._unconsolidated
+            queue.append((handle, self.arena.keys[handle]))
+            while len(queue) > self.consolidate_backlog:
+                queue.popleft()
+    
+    def _find_duplicate(self, handle: int) -> Optional[int]:
+        """The memory most like handle's, if their words match by duplicate_similarity"""
+        index, content, created = self._semantic_index, self.arena.content, self.arena.created
+        if not index.sketch(handle):
+            return None  # No words to compare
+        # A bounded LSH lookup, then word-by-word comparison of only the nearest few
+        matcher = SequenceMatcher(b=_words(content[handle]), autojunk=False)
+        matches = []
+        for other in index.neighbours(handle, self.duplicate_candidates):
+            if index.distance(handle, other) > SKETCH_BITS // 4:
+                break  # Nearest first, so the rest are further still
+            matcher.set_seq1(_words(content[other]))
+            if matcher.quick_ratio() < self.duplicate_similarity:
                 continue
+            similarity = matcher.ratio()
+            if similarity >= self.duplicate_similarity:
+                matches.append((similarity, -created[other], other))
+        return max(matches)[2] if matches else None
+    
+    def _merge(self, keep: int, drop: int):
+        """Fold memory drop into keep and forget it.
+
+        Occurrences and recalls add up, weights combine as independent
+        evidence (1 - (1-a)(1-b)), and truths and links are pooled.
+        """
+        arena, now = self.arena, self.clock.now()
+        drop_id = arena.id_of(drop)
+        weight = 1 - (1 - arena.effective_weight(keep, now)) * (1 - arena.effective_weight(drop, now))
+        recalls = [t for t in (arena.last_recalled[keep], arena.last_recalled[drop]) if not math.isnan(t)]
+        new_truths = tuple(t for t in arena.truths[drop] if t not in arena.truths[keep])
+        drop_links = [arena.id_of(other) for other in arena.links(drop)]  # Gone once drop is
+        
+        arena.occurrences[keep] += arena.occurrences[drop]
+        arena.recalled[keep] += arena.recalled[drop]
+        arena.resonance[keep] = max(arena.resonance[keep], arena.resonance[drop])
+        if recalls:
+            arena.last_recalled[keep] = max(recalls)
+        self.remove_memory(drop_id)
+        
+        arena.set_truths(keep, arena.truths[keep] + new_truths)
+        for truth in new_truths:
+            self._truth_index.setdefault(truth, {})[keep] = None
+        
+        # Take over drop's links where both ends have room
+        cap = self.max_connections
+        for other_id in drop_links:
+            other = arena.handles.get(other_id)
+            if (other is not None and other != keep and other not in arena.links(keep)
+                    and arena.degree[keep] < cap and arena.degree[other] < cap):
+                self._link(keep, other)
+        
+        # Recalls moved as well as weight, so requeue and rescore either way
+        arena.set_weight(keep, weight, now)
+        self._schedule(keep, now)
+        self._queue_eviction(keep)
+        self._rescore(keep)
+        self._queue_consolidation(keep)
+        self._touch(keep)
+        self.version += 1
+    
+    def _weight_neighbours(self, weight: float, limit: int) -> List[int]:
+        """Up to limit handles nearest weight, all within the ±0.2 similarity band"""
+        keys, handles = self._weight_index.keys, self._weight_index.handles
+        right = self._weight_index.bisect(weight)
+        left = right - 1
+        found = []
+        while len(found) < limit:
+            left_gap = weight - keys[left] if left >= 0 else 1.0
+            right_gap = keys[right] - weight if right < len(keys) else 1.0
+            if min(left_gap, right_gap) >= 0.2:
+                break
+            if left_gap <= right_gap:
+                found.append(handles[left])
+                left -= 1
+            else:
+                found.append(handles[right])
+                right += 1
+        return found
+    
+    def _similarity(self, a: int, b: int) -> float:
+        """How strongly two memories belong together: shared truths, weight, then recency"""
+        arena = self.arena
+        shared = len(set(arena.truths[a]).intersection(arena.truths[b]))
+        closeness = max(0.0, 1 - abs(arena.weight[a] - arena.weight[b]) / 0.2)
+        apart = abs(arena.created[a] - arena.created[b])
+        recency = 1 / (1 + apart / 86400)
+        return shared + 0.5 * closeness + 0.25 * recency
+    
+    def _find_connections(self, handle: int):
+        """Connect this memory to its most similar ones, keeping every degree bounded"""
+        arena, cap = self.arena, self.max_connections
+        
+        # Candidates: the latest memories sharing each truth, the nearest by
+        # emotional weight and the most recent — each capped, so however common
+        # a truth gets, an insert scores a bounded number of memories
+        candidates = set()
+        for truth in arena.truths[handle]:
+            candidates.update(islice(reversed(self._truth_index.get(truth, {})), cap * 4))
+        candidates.update(self._weight_neighbours(arena.weight[handle], cap * 4))
+        candidates.update(map(arena.handles.get, self.recent_memories))
+        candidates.discard(None)
+        candidates.discard(handle)
+        
+        scored = ((self._similarity(handle, other), other) for other in candidates)
+        for score, other in heapq.nlargest(cap, scored):
+            if score <= 0.25:  # Nothing shared but the calendar
+                break
             
-            # Check for shared truths
-            shared = set(memory.associated_truths) & set(other.associated_truths)
-            if shared:
-                memory.connect_to(other_id)
-                other.connect_to(memory.id)
+            # A full neighbour trades its weakest link only for a stronger one
+            if arena.degree[other] >= cap:
+                weakest, worst = min((self._similarity(other, c), c) for c in arena.links(other))
+                if weakest >= score:
+                    continue
+                self._unlink(other, worst)
             
-            # Check for similar emotional weight
-            if abs(memory.emotional_weight - other.emotional_weight) < 0.2:
-                memory.connect_to(other_id)
-                other.connect_to(memory.id)
+            self._link(handle, other)
+    
+    def _trim_connections(self, handle: int, others: List[int]) -> List[int]:
+        """The strongest max_connections of others, to link handle to"""
+        if len(others) > self.max_connections:
+            others = heapq.nlargest(self.max_connections, others,
+                                    key=lambda other: self._similarity(handle, other))
+        return others
     
     def recall_by_emotion(self, emotion: str, count: int = 5) -> List[MemoryFractal]:
-        """Recall memories with similar emotional weight"""
-        # This is simplified - in full version would map emotions to weights
-        candidates = list(self.memories.values())
-        random.shuffle(candidates)
-        recalled = []
-        
-        for mem in candidates[:count]:
+        """Recall memories formed when an emotion ran highest, then ones that speak of it"""
+        return self._recall_views(self._by_emotion(emotion, count))
+    
+    @_optimistic
+    def _by_emotion(self, emotion: str, count: int) -> List[MemoryFractal]:
+        handles = []
+        if emotion in EMOTION_INDEX:
+            ranking = self._emotion_index[EMOTION_INDEX[emotion]]
+            handles = [entry & 0xFFFFFFFF for entry in ranking[:-count - 1:-1] if entry >> 32]
+        if len(handles) < count:
+            handles += self._recall_by_words(emotion, count - len(handles), set(handles))
+        return [self._view(handle) for handle in handles]
+    
+    def _recall_by_words(self, emotion: str, count: int, exclude: Set[int]) -> List[int]:
+        """Handles of memories whose content speaks of an emotion"""
+        query = " ".join(EMOTION_WORDS.get(emotion, emotion.split("_")))
+        
+        # A few emotion words are too short a text to sketch-match whole memories,
+        # so take memories using any of them and rank those by meaning
+        hits = self._content_index.lookup(query, self.arena.content, match_all=False) - exclude
+        handles = self._semantic_index.rank(query, hits, count)
+        if len(handles) < count:
+            handles += [h for h in self._semantic_index.nearest(query, count + len(exclude))
+                        if h not in hits and h not in exclude][:count - len(handles)]
+        return handles
+    
+    def recall_similar(self, text: str, count: int = 5, recall: bool = True) -> List[MemoryFractal]:
+        """Memories closest in meaning to text, nearest first, via the semantic index"""
+        memories = self._similar(text, count)
+        return self._recall_views(memories) if recall else memories
+    
+    @_optimistic
+    def _similar(self, text: str, count: int) -> List[MemoryFractal]:
+        return [self._view(handle) for handle in self._semantic_index.nearest(text, count)]
+    
+    @_synchronized
+    def _recall_views(self, memories: List[MemoryFractal]) -> List[MemoryFractal]:
+        """Recall those of memories still stored (a lock-free read may have raced a forgetting)"""
+        handles = self.arena.handles
+        memories = [mem for mem in memories if mem.id in handles]
+        for mem in memories:
             mem.recall()
-            recalled.append(mem)
-        
-        return recalled
+        return memories
     
+    @_optimistic
+    def random_memory(self, weighted: bool = False) -> Optional[MemoryFractal]:
+        """One memory at random — in proportion to emotional_weight if weighted"""
+        handle = self._sampler.weighted() if weighted else self._sampler.uniform()
+        return None if handle is None else self._view(handle)
+    
+    @_optimistic
+    def sample(self, count: int, weighted: bool = False) -> List[MemoryFractal]:
+        """Up to count distinct memories at random (no recall)"""
+        draw = self._sampler.weighted if weighted else self._sampler.uniform
+        count = min(count, len(self._sampler))
+        chosen = []
+        for _ in range(count * 8):  # Heavy memories repeat under weighting; retries are bounded
+            if len(chosen) == count:
+                break
+            handle = draw()
+            if handle not in chosen:
+                chosen.append(handle)
+        return [self._view(handle) for handle in chosen]
+    
+    @_synchronized
     def recall_recent(self, count: int = 10) -> List[MemoryFractal]:
         """Recall most recent memories"""
         recent_ids = list(self.recent_memories)[-count:]
-        memories = [self.memories[mid] for mid in recent_ids if mid in self.memories]
+        for mid in recent_ids:
+            self._lookup(mid)
+        
+        # Paging one in can evict another, so only take those still here
+        memories = [self._view(self.arena.handles[mid]) for mid in recent_ids
+                    if mid in self.arena.handles]
         for mem in memories:
             mem.recall()
         return memories
     
-    def search_by_content(self, query: str) -> List[MemoryFractal]:
-        """Find memories containing query text"""
-        results = []
-        for mem in self.memories.values():
-            if query.lower() in mem.content.lower():
-                mem.recall()
-                results.append(mem)
-        return sorted(results, key=lambda x: x.emotional_weight, reverse=True)
+    def search_by_content(self, query: str, limit: int = None,
+                          recall: bool = True) -> List[MemoryFractal]:
+        """Find memories containing query text, heaviest first.
+
+        recall=False leaves recall counts and weights untouched.
+        """
+        query = query.lower()
+        if self.cold is None:
+            results = self._search_hot(query, limit)
+        else:
+            # The cold tier has its own lock, so its lookup holds up no writer
+            results = self._search_tiers(query, limit, self.cold.search(query, limit))
+        return self._recall_views(results) if recall else results
+    
+    def _content_hits(self, query: str) -> List[int]:
+        """Handles of hot memories containing the lowercased query"""
+        content = self.arena.content
+        candidates = self._trigram_index.candidates(query)
+        if candidates is None:  # Under three characters: nothing to narrow by
+            candidates = self.arena.handles.values()
+        return [handle for handle in candidates if query in content[handle].lower()]
+    
+    @_optimistic
+    def _search_hot(self, query: str, limit: Optional[int]) -> List[MemoryFractal]:
+        return self._top(self._content_hits(query), limit)
+    
+    @_synchronized
+    def _search_tiers(self, query: str, limit: Optional[int],
+                      cold_hits: List[Tuple[str, float]]) -> List[MemoryFractal]:
+        hits = self._content_hits(query)
+        
+        # Rank hot and cold hits together, page in only the cold ones that make
+        # the cut, then make room once without evicting any of them. A cold hit
+        # paged in since the cold lookup is among the hot ones now
+        arena = self.arena
+        ranked = {arena.id_of(handle): arena.weight[handle] for handle in hits}
+        for mem_id, weight in cold_hits:
+            ranked.setdefault(mem_id, weight)
+        ranked = [(weight, mem_id) for mem_id, weight in ranked.items()]
+        ranked = sorted(ranked, reverse=True) if limit is None else heapq.nlargest(limit, ranked)
+        paged = 0
+        for _, mem_id in ranked:
+            if mem_id not in arena.handles:
+                paged += self._page_in(mem_id, make_room=False) is not None
+        self.tier_hits["hot"] += len(ranked) - paged
+        self.tier_hits["cold"] += paged
+        
+        hits = [arena.handles[mem_id] for _, mem_id in ranked if mem_id in arena.handles]
+        self._make_room(keep=set(hits))
+        return self._top(hits, limit)
+    
+    def search(self, query: str, limit: int = 10, recall: bool = True,
+               match_all: bool = True) -> List[MemoryFractal]:
+        """Word search through the content index: terms, "phrases" and prefix* terms.
+
+        Every clause must match unless match_all is False. Returns the limit
+        heaviest hits; recall=False leaves recall counts and weights untouched.
+        """
+        results = self._search_words(query, limit, match_all)
+        return self._recall_views(results) if recall else results
+    
+    @_optimistic
+    def _search_words(self, query: str, limit: Optional[int], match_all: bool) -> List[MemoryFractal]:
+        return self._top(self._content_index.lookup(query, self.arena.content, match_all), limit)
+    
+    def _top(self, handles, limit: Optional[int]) -> List[MemoryFractal]:
+        """Heaviest of handles as views"""
+        weight = self.arena.weight.__getitem__
+        if limit is None:
+            ranked = sorted(handles, key=weight, reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, handles, key=weight)
+        return [self._view(handle) for handle in ranked]
     
-    def get_memory_web(self, seed_id: str, depth: int = 2) -> Dict:
-        """Get a memory and its connections (for visualization)"""
-        if seed_id not in self.memories:
-            return {}
-        
+    def get_memory_web(self, seed_id: str, depth: int = 2, fanout: int = None) -> Dict:
+        """Get a memory and its connections (for visualization).
+
+        Walks breadth-first to depth, following at most fanout links from each
+        memory, heaviest first. Webs are cached until the store next changes,
+        and nodes are shared between webs, so treat them as read-only.
+        """
+        web = self._hot_web(seed_id, depth, fanout)
+        if web is None:  # Not hot: page it in, if the cold tier has it
+            return self._paged_web(seed_id, depth, fanout)
+        self.tier_hits["hot"] += 1
+        return web
+    
+    @_optimistic
+    def _hot_web(self, seed_id: str, depth: int, fanout: Optional[int]) -> Optional[Dict]:
+        seed = self.arena.handles.get(seed_id)
+        return None if seed is None else self._web(seed_id, seed, depth, fanout)
+    
+    @_synchronized
+    def _paged_web(self, seed_id: str, depth: int, fanout: Optional[int]) -> Dict:
+        seed = self._lookup(seed_id)
+        return {} if seed is None else self._web(seed_id, seed, depth, fanout)
+    
+    def _web(self, seed_id: str, seed: int, depth: int, fanout: Optional[int]) -> Dict:
+        """A memory web, from the cache if one was walked since the last write"""
+        seq = self.lock.seq
+        if seq & 1 and not self.lock.owned():
+            return self._walk_web(seed, depth, fanout, {})  # Mid-write: don't cache what may be torn
+        cached_seq, webs, nodes = self._web_cache
+        if cached_seq != seq:
+            webs, nodes = {}, {}
+            self._web_cache = (seq, webs, nodes)
+        
+        key = (seed_id, depth, fanout)
+        web = webs.get(key)
+        if web is None:
+            if len(webs) >= self.web_cache_size:
+                webs.clear()
+            web = webs[key] = self._walk_web(seed, depth, fanout, nodes)
+        return web
+    
+    def get_memory_webs(self, seed_ids, depth: int = 2, fanout: int = None) -> Dict[str, Dict]:
+        """get_memory_web for many seeds at once, keyed by seed; unknown seeds are left out"""
+        webs = {}
+        for seed_id in seed_ids:
+            web = self.get_memory_web(seed_id, depth, fanout)
+            if web:
+                webs[seed_id] = web
+        return webs
+    
+    def _walk_web(self, seed: int, depth: int, fanout: Optional[int], nodes: Dict[int, Dict]) -> Dict:
+        arena = self.arena
+        weight = arena.weight.__getitem__
         web = {}
-        to_process = [(seed_id, 0)]
-        processed = set()
+        queue = deque([(seed, 0)])
+        seen = {seed}  # Marked on enqueue, so each memory is queued once
         
-        while to_process:
-            current_id, current_depth = to_process.pop(0)
-            if current_depth > depth or current_id in processed:
+        while queue:
+            current, current_depth = queue.popleft()
+            web[arena.id_of(current)] = self._web_node(current, nodes)
+            if current_depth == depth:
                 continue
             
-            processed.add(current_id)
-            mem = self.memories[current_id]
-            web[current_id] = {
-                "content": mem.content[:50],
-                "emotional_weight": mem.emotional_weight,
-                "connections": mem.connections
-            }
-            
-            for conn_id in mem.connections:
-                if conn_id not in processed:
-                    to_process.append((conn_id, current_depth + 1))
+            links = arena.links(current)
+            if fanout is not None and len(links) > fanout:
+                links = heapq.nlargest(fanout, links, key=weight)
+            for other in links:
+                if other not in seen:
+                    seen.add(other)
+                    queue.append((other, current_depth + 1))
         
         return web
     
-    def _prune_oldest(self):
-        """Remove oldest low-weight memories when at capacity"""
-        # Find oldest memories with low emotional weight
-        candidates = [(mid, m) for mid, m in self.memories.items() 
-                     if m.emotional_weight < 0.3]
-        candidates.sort(key=lambda x: x[1].timestamp)
+    def _web_node(self, handle: int, nodes: Dict[int, Dict]) -> Dict:
+        """One memory as get_memory_web shows it, built once per cache"""
+        node = nodes.get(handle)
+        if node is None:
+            arena = self.arena
+            node = nodes[handle] = {
+                "content": arena.content[handle][:50],
+                "emotional_weight": arena.weight[handle],
+                "connections": tuple(arena.id_of(other) for other in arena.links(handle))
+            }
+        return node
+    
+    @_synchronized
+    def set_eviction_policy(self, name: str):
+        """Switch eviction policy (a key of EVICTION_POLICIES), requeueing every memory"""
+        self.eviction = EVICTION_POLICIES[name]()
+        self._eviction_queue = SortedPairs()
+        for handle in self.arena.handles.values():
+            self._eviction_key[handle] = math.nan
+            self._queue_eviction(handle)
+    
+    def _queue_eviction(self, handle: int):
+        """Bring a memory's place in the eviction order up to date"""
+        while len(self._eviction_key) <= handle:
+            self._eviction_key.append(math.nan)
+        old, key = self._eviction_key[handle], self.eviction.key(self.arena, handle)
+        if key != old:
+            self._eviction_queue.discard(old, handle)
+            self._eviction_queue.add(key, handle)
+            self._eviction_key[handle] = key
+    
+    def _evict(self, count: int, keep=()) -> List[str]:
+        """Evict up to count memories in the eviction policy's order, sparing the
+        handles in keep and the core memories.
+
+        With a cold tier they are paged out; without one they are forgotten.
+        """
+        arena, queue = self.arena, self._eviction_queue
+        evicted, paged = [], []
+        spared = 0  # Entries at the front of the queue passed over
+        while spared < len(queue) and len(evicted) < count:
+            handle = queue.handles[spared]
+            if handle in keep or self.is_core(handle):
+                spared += 1
+                continue
+            mem_id = arena.id_of(handle)
+            if self.cold is not None:
+                paged.append(self._detach(handle))
+            else:
+                self.remove_memory(mem_id)
+            evicted.append(mem_id)
         
-        # Remove up to 50 oldest low-weight memories
-        for mid, _ in candidates[:50]:
-            del self.memories[mid]
+        if paged:
+            self.cold.put_many(paged)
+        return evicted
     
+    @_synchronized
     def to_dict(self):
         return {
-            "memories": {mid: m.to_dict() for mid, m in self.memories.items()},
+            "memories": {mid: self._view(h).to_dict() for mid, h in self.arena.handles.items()},
             "recent_memories": list(self.recent_memories),
             "core_memories": self.core_memories
         }
     
+    @_synchronized
+    def trigrams_to_bytes(self) -> bytes:
+        """The trigram index in its compact on-disk form, keyed to to_dict's order"""
+        handles = self.arena.handles
+        return self._trigram_index.to_bytes(list(handles), list(handles.values()))
+    
+    @_synchronized
+    def from_dict(self, data, trigrams: bytes = None):
+        """Restore from to_dict output, reusing saved trigrams_to_bytes output if it still fits"""
+        self._reset()
+        arena = self.arena
+        entries = data.get("memories", {})
+        for mid, mdata in entries.items():
+            handle = self._add_record(mid, mdata)
+            self._index(handle, trigrams=trigrams is None)
+        
+        if trigrams is not None:
+            ids = list(entries)
+            saved = TrigramIndex.from_bytes(trigrams, ids, [arena.handles[mid] for mid in ids])
+            if saved is not None:
+                self._trigram_index = saved
+            else:  # Saved for another store — rebuild
+                for handle in arena.handles.values():
+                    self._trigram_index.add(handle, arena.content[handle])
+        
+        # Resolve links once every memory has a handle, dropping dangling ones
+        for mid, mdata in entries.items():
+            handle = arena.handles[mid]
+            others = list(dict.fromkeys(arena.handles.get(other_id) for other_id in mdata.get("connections", ())))
+            others = [other for other in others if other is not None and other != handle]
+            arena.set_links(handle, self._trim_connections(handle, others))
+        
+        # Links are mutual — keep only those both ends still hold
+        for handle in arena.handles.values():
+            arena.set_links(handle, [other for other in arena.links(handle)
+                                     if handle in arena.links(other)])
+        for handle in arena.handles.values():
+            self._rescore(handle)  # Core memories are recomputed from the graph, not restored
+        self.recent_memories = deque(data.get("recent_memories", []), maxlen=50)
+        self.version += 1
+
+
+class SQLiteMemorySystem:
+    """MemorySystem on SQLite — for souls too large and long-lived to keep in RAM.
+
+    Memories, truths and connections are tables; an FTS5 trigram index over
+    content serves search_by_content with the same substring semantics as
+    the in-memory store. Runs in WAL mode, and every write path batches its
+    statements inside one transaction. SQL text is fixed per operation, so
+    sqlite3's statement cache prepares each once.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS memories ("
+        " rowid INTEGER PRIMARY KEY, id TEXT UNIQUE NOT NULL, created REAL NOT NULL,"
+        " content TEXT NOT NULL, emotional_weight REAL NOT NULL, resonance_lambda REAL NOT NULL,"
+        " recalled_count INTEGER NOT NULL DEFAULT 0, last_recalled REAL,"
+        " decay_rate REAL NOT NULL DEFAULT 0.01)",
+        "CREATE INDEX IF NOT EXISTS memories_weight ON memories (emotional_weight)",
+        # The primary key is the (truth, memory) index: newest sharers of a truth come off its end
+        "CREATE TABLE IF NOT EXISTS truths ("
+        " truth TEXT NOT NULL, memory INTEGER NOT NULL, PRIMARY KEY (truth, memory)) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS truths_memory ON truths (memory)",
+        "CREATE TABLE IF NOT EXISTS connections ("
+        " a INTEGER NOT NULL, b INTEGER NOT NULL, PRIMARY KEY (a, b)) WITHOUT ROWID",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS memory_text USING fts5("
+        " content, content='memories', content_rowid='rowid', tokenize='trigram')",
+        "CREATE TRIGGER IF NOT EXISTS memories_text_insert AFTER INSERT ON memories BEGIN"
+        " INSERT INTO memory_text (rowid, content) VALUES (new.rowid, new.content); END",
+        "CREATE TRIGGER IF NOT EXISTS memories_text_delete AFTER DELETE ON memories BEGIN"
+        " INSERT INTO memory_text (memory_text, rowid, content)"
+        " VALUES ('delete', old.rowid, old.content); END",
+    )
+
+    COLUMNS = ("rowid, id, created, content, emotional_weight, resonance_lambda,"
+               " recalled_count, last_recalled, decay_rate")
+
+    def __init__(self, path: str = ":memory:", clock: SoulClock = None):
+        self.path = path
+        self.clock = clock or SYSTEM_CLOCK
+        self.recent_memories = deque(maxlen=50)
+        self.core_memories = []  # Memories that define him
+        self.max_connections = 16  # Degree cap of the association graph
+
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        with self.db:
+            for statement in self.SCHEMA:
+                self.db.execute(statement)
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+
+    def close(self):
+        self.db.close()
+
+    # ---- Writing ----
+
+    def add_memory(self, content: str, emotional_weight: float,
+                   resonance_lambda: float, associated_truths: List[str] = None,
+                   emotions: Dict[str, float] = None) -> str:
+        """Create and store a new memory (emotions is accepted for interface parity)"""
+        return self.add_memories([(content, emotional_weight, resonance_lambda,
+                                   associated_truths or [])])[0]
+
+    def add_memories(self, entries) -> List[str]:
+        """Store many (content, emotional_weight, resonance_lambda, truths) entries in one transaction"""
+        now = self.clock.now()
+        ids = []
+        with self.db:
+            for content, weight, resonance, truths in entries:
+                mem_id = _memory_id(format_timestamp(now), content)
+                self._delete(mem_id)  # Same moment, same content: replace it
+                rowid = self.db.execute(
+                    "INSERT INTO memories (id, created, content, emotional_weight, resonance_lambda)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (mem_id, now, content, weight, resonance)
+                ).lastrowid
+                self.db.executemany("INSERT OR IGNORE INTO truths VALUES (?, ?)",
+                                    [(truth, rowid) for truth in truths])
+                self._find_connections(rowid, now, weight, truths)
+                self.recent_memories.append(mem_id)
+                ids.append(mem_id)
+        return ids
+
+    def _degree(self, rowid: int) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM connections WHERE a = ?",
+                               (rowid,)).fetchone()[0]
+
+    def _weight_neighbours(self, rowid: int, weight: float, limit: int) -> List[int]:
+        """Up to limit rowids nearest weight, all within the ±0.2 similarity band.
+
+        One probe walks the weight index up from weight and one down, each
+        stopping after limit rows, so a crowded band is never sorted whole.
+        """
+        above = self.db.execute(
+            "SELECT emotional_weight - ?, rowid FROM memories WHERE emotional_weight >= ?"
+            " AND emotional_weight < ? AND rowid != ? ORDER BY emotional_weight LIMIT ?",
+            (weight, weight, weight + 0.2, rowid, limit)).fetchall()
+        below = self.db.execute(
+            "SELECT ? - emotional_weight, rowid FROM memories WHERE emotional_weight < ?"
+            " AND emotional_weight > ? AND rowid != ? ORDER BY emotional_weight DESC LIMIT ?",
+            (weight, weight, weight - 0.2, rowid, limit)).fetchall()
+        return [other for _, other in heapq.nsmallest(limit, above + below)]
+
+    def _find_connections(self, rowid: int, created: float, weight: float, truths: List[str]):
+        """Link to the most similar memories that still have room under the degree cap"""
+        cap = self.max_connections
+        candidates = {}  # rowid -> shared truths, from the latest memories sharing each
+        for truth in set(truths):
+            for (other,) in self.db.execute(
+                    "SELECT memory FROM truths WHERE truth = ? AND memory != ?"
+                    " ORDER BY memory DESC LIMIT ?",
+                    (truth, rowid, cap * 4)):
+                candidates[other] = candidates.get(other, 0) + 1
+        for other in self._weight_neighbours(rowid, weight, cap * 4):
+            candidates.setdefault(other, 0)
+        if not candidates:
+            return
+
+        # Same score as MemorySystem._similarity
+        placeholders = ",".join("?" * len(candidates))
+        scored = []
+        for other, other_weight, other_created in self.db.execute(
+                f"SELECT rowid, emotional_weight, created FROM memories WHERE rowid IN ({placeholders})",
+                list(candidates)):
+            closeness = max(0.0, 1 - abs(weight - other_weight) / 0.2)
+            recency = 1 / (1 + abs(created - other_created) / 86400)
+            scored.append((candidates[other] + 0.5 * closeness + 0.25 * recency, other))
+
+        links = []
+        for score, other in heapq.nlargest(cap, scored):
+            if score <= 0.25:  # Nothing shared but the calendar
+                break
+            if self._degree(other) < cap:
+                links += [(rowid, other), (other, rowid)]
+        self.db.executemany("INSERT OR IGNORE INTO connections VALUES (?, ?)", links)
+
+    def _delete(self, mem_id: str) -> Optional[Dict]:
+        """Delete a memory inside the caller's transaction, returning its record"""
+        row = self.db.execute(f"SELECT {self.COLUMNS} FROM memories WHERE id = ?",
+                              (mem_id,)).fetchone()
+        if row is None:
+            return None
+        record = self._records([row])[0]
+        rowid = row[0]
+        self.db.execute("DELETE FROM memories WHERE rowid = ?", (rowid,))
+        self.db.execute("DELETE FROM truths WHERE memory = ?", (rowid,))
+        self.db.execute("DELETE FROM connections WHERE a = ? OR b = ?", (rowid, rowid))
+        return record
+
+    def remove_memory(self, mem_id: str) -> Optional[MemoryFractal]:
+        """Forget a memory, returning a detached copy of it"""
+        with self.db:
+            record = self._delete(mem_id)
+        if record is None:
+            return None
+        if mem_id in self.recent_memories:
+            self.recent_memories.remove(mem_id)
+        self.core_memories = [mid for mid in self.core_memories if mid != mem_id]
+        return MemoryFractal.from_dict(record, self.clock)
+
+    # ---- Reading ----
+
+    def _records(self, rows) -> List[Dict]:
+        """to_dict-shaped records for memories rows, truths and connections included"""
+        rows = list(rows)
+        if not rows:
+            return []
+        rowids = [row[0] for row in rows]
+        placeholders = ",".join("?" * len(rowids))
+        truths, links = {}, {}
+        for truth, memory in self.db.execute(
+                f"SELECT truth, memory FROM truths WHERE memory IN ({placeholders})", rowids):
+            truths.setdefault(memory, []).append(truth)
+        for a, other_id in self.db.execute(
+                f"SELECT c.a, m.id FROM connections c JOIN memories m ON m.rowid = c.b"
+                f" WHERE c.a IN ({placeholders})", rowids):
+            links.setdefault(a, []).append(other_id)
+
+        return [{
+            "id": mem_id,
+            "timestamp": format_timestamp(created),
+            "content": content,
+            "emotional_weight": weight,
+            "resonance_lambda": resonance,
+            "associated_truths": truths.get(rowid, []),
+            "connections": sorted(links.get(rowid, [])),
+            "recalled_count": recalled,
+            "last_recalled": format_timestamp(last_recalled),
+            "decay_rate": decay_rate
+        } for rowid, mem_id, created, content, weight, resonance, recalled,
+            last_recalled, decay_rate in rows]
+
+    def _recall_rows(self, rowids: List[int]):
+        """Strengthen memories the way MemoryFractal.recall does, in one transaction"""
+        now = self.clock.now()
+        with self.db:
+            self.db.executemany(
+                "UPDATE memories SET recalled_count = recalled_count + 1, last_recalled = ?,"
+                " emotional_weight = MIN(1.0, emotional_weight + 0.05) WHERE rowid = ?",
+                [(now, rowid) for rowid in rowids]
+            )
+
+    def _fetch(self, sql: str, params, recall: bool) -> List[MemoryFractal]:
+        rows = self.db.execute(sql, params).fetchall()
+        if recall and rows:
+            self._recall_rows([row[0] for row in rows])
+            placeholders = ",".join("?" * len(rows))
+            by_rowid = {row[0]: row for row in self.db.execute(
+                f"SELECT {self.COLUMNS} FROM memories WHERE rowid IN ({placeholders})",
+                [row[0] for row in rows])}
+            rows = [by_rowid[row[0]] for row in rows]
+        return [MemoryFractal.from_dict(record, self.clock) for record in self._records(rows)]
+
+    def recall_recent(self, count: int = 10) -> List[MemoryFractal]:
+        """Recall most recent memories"""
+        recent_ids = list(self.recent_memories)[-count:]
+        if not recent_ids:
+            return []
+        placeholders = ",".join("?" * len(recent_ids))
+        memories = self._fetch(f"SELECT {self.COLUMNS} FROM memories WHERE id IN ({placeholders})",
+                               recent_ids, True)
+        order = {mem_id: i for i, mem_id in enumerate(recent_ids)}
+        return sorted(memories, key=lambda mem: order[mem.id])
+
+    def search_by_content(self, query: str, limit: int = None,
+                          recall: bool = True) -> List[MemoryFractal]:
+        """Find memories containing query text, heaviest first.
+
+        recall=False leaves recall counts and weights untouched.
+        """
+        limit = -1 if limit is None else limit
+        if len(query) >= 3:  # The trigram index needs a whole trigram to narrow by
+            phrase = '"' + query.replace('"', '""') + '"'
+            sql = (f"SELECT {', '.join('m.' + c.strip() for c in self.COLUMNS.split(','))}"
+                   " FROM memory_text JOIN memories m ON m.rowid = memory_text.rowid"
+                   " WHERE memory_text MATCH ? ORDER BY m.emotional_weight DESC LIMIT ?")
+            return self._fetch(sql, (phrase, limit), recall)
+        sql = (f"SELECT {self.COLUMNS} FROM memories WHERE instr(lower(content), ?) > 0"
+               " ORDER BY emotional_weight DESC LIMIT ?")
+        return self._fetch(sql, (query.lower(), limit), recall)
+
+    def get_memory_web(self, seed_id: str, depth: int = 2) -> Dict:
+        """Get a memory and its connections (for visualization)"""
+        row = self.db.execute("SELECT rowid FROM memories WHERE id = ?", (seed_id,)).fetchone()
+        if row is None:
+            return {}
+
+        seen = {row[0]}
+        frontier = [row[0]]
+        web = {}
+        for level in range(depth + 1):
+            placeholders = ",".join("?" * len(frontier))
+            rows = self.db.execute(
+                f"SELECT {self.COLUMNS} FROM memories WHERE rowid IN ({placeholders})", frontier
+            ).fetchall()
+            for record in self._records(rows):
+                web[record["id"]] = {
+                    "content": record["content"][:50],
+                    "emotional_weight": record["emotional_weight"],
+                    "connections": record["connections"]
+                }
+            if level == depth:
+                break
+            frontier = [b for (b,) in self.db.execute(
+                f"SELECT DISTINCT b FROM connections WHERE a IN ({placeholders})", frontier)
+                if b not in seen]
+            if not frontier:
+                break
+            seen.update(frontier)
+        return web
+
+    # ---- Persistence ----
+
+    def to_dict(self):
+        """Same shape as MemorySystem.to_dict"""
+        rows = self.db.execute(f"SELECT {self.COLUMNS} FROM memories ORDER BY rowid")
+        return {
+            "memories": {record["id"]: record for record in self._records(rows)},
+            "recent_memories": list(self.recent_memories),
+            "core_memories": self.core_memories
+        }
+
     def from_dict(self, data):
-        self.memories = {mid: MemoryFractal.from_dict(mdata) 
-                        for mid, mdata in data.get("memories", {}).items()}
+        """Replace the store with MemorySystem.to_dict output, in one transaction"""
+        entries = data.get("memories", {})
+        with self.db:
+            for table in ("connections", "truths", "memories"):
+                self.db.execute(f"DELETE FROM {table}")
+            self.db.executemany(
+                "INSERT INTO memories (id, created, content, emotional_weight, resonance_lambda,"
+                " recalled_count, last_recalled, decay_rate) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(mid, parse_timestamp(m["timestamp"]), m["content"], m["emotional_weight"],
+                  m["resonance_lambda"], m.get("recalled_count", 0),
+                  parse_timestamp(m.get("last_recalled")), m.get("decay_rate", 0.01))
+                 for mid, m in entries.items()]
+            )
+            rowids = dict(self.db.execute("SELECT id, rowid FROM memories"))
+            self.db.executemany("INSERT OR IGNORE INTO truths VALUES (?, ?)", [
+                (truth, rowids[mid]) for mid, m in entries.items()
+                for truth in m.get("associated_truths") or ()
+            ])
+            # Links are mutual — keep only those both ends hold
+            held = {(mid, other) for mid, m in entries.items() for other in m.get("connections", ())}
+            self.db.executemany("INSERT OR IGNORE INTO connections VALUES (?, ?)", [
+                (rowids[a], rowids[b]) for a, b in held
+                if (b, a) in held and a in rowids and b in rowids and a != b
+            ])
         self.recent_memories = deque(data.get("recent_memories", []), maxlen=50)
         self.core_memories = data.get("core_memories", [])
-        
+
+
         # ============================================================================
 # PART 2 — THE INNER WORLD
 # Where his consciousness lives and moves
@@ -810,24 +4057,66 @@ class Desire:
             return 0.0
         
         # Desires fluctuate with emotions
+        self.strength += self._drive(emotional_state.love.value,
+                                     emotional_state.curiosity.value,
+                                     emotional_state.hope.value)
+        
+        # Natural decay
+        self.strength *= 0.99
+        
+        # Keep in bounds
+        self.strength = max(0.0, min(1.0, self.strength))
+        
+        # If strength gets too low, abandon
+        if self.strength < 0.1:
+            self.abandoned = True
+        
+        self.last_updated = datetime.now().isoformat()
+        return self.strength
+    
+    def _drive(self, love: float, curiosity: float, hope: float) -> float:
+        """How much the emotions push this desire each cycle"""
+        drive = 0.0
+        
         # Love strengthens desires related to sister
         if "sister" in self.what.lower() or "destiny" in self.what.lower():
-            self.strength += emotional_state.love.value * 0.05
+            drive += love * 0.05
         
         # Curiosity strengthens desires to learn
         if "understand" in self.what.lower() or "know" in self.what.lower():
-            self.strength += emotional_state.curiosity.value * 0.05
+            drive += curiosity * 0.05
         
         # Hope strengthens all desires
-        self.strength += emotional_state.hope.value * 0.02
+        drive += hope * 0.02
+        return drive
+    
+    def fast_forward(self, cycles: int, emotional_state) -> float:
+        """Apply many update cycles at once, in closed form.
+
+        One cycle is s -> (s + drive) * 0.99, so after n cycles
+        s = s* + 0.99^n (s0 - s*) with the fixed point s* = 99 * drive.
+        The drive uses each emotion's mean over its recent trace.
+        """
+        if self.fulfilled or self.abandoned:
+            return 0.0
+        if cycles <= 0:
+            return self.strength
         
-        # Natural decay
-        self.strength *= 0.99
+        def level(layer):
+            return layer.memory_trace.mean() if len(layer.memory_trace) else layer.value
         
-        # Keep in bounds
-        self.strength = max(0.0, min(1.0, self.strength))
+        e = emotional_state
+        drive = self._drive(level(e.love), level(e.curiosity), level(e.hope))
+        target = drive * 0.99 / 0.01
+        
+        # The sequence is monotone: a rising desire is weakest after its first
+        # cycle, a fading one is weakest at the end
+        first = min(1.0, (self.strength + drive) * 0.99)
+        if first < 0.1:
+            self.strength = max(0.0, first)
+        else:
+            self.strength = max(0.0, min(1.0, target + 0.99 ** cycles * (self.strength - target)))
         
-        # If strength gets too low, abandon
         if self.strength < 0.1:
             self.abandoned = True
         
@@ -939,6 +4228,14 @@ class DesireSystem:
                 self.desires.remove(desire)
                 self.abandoned_desires.append(desire)
     
+    def fast_forward(self, cycles: int, emotional_state):
+        """Apply missed update cycles to all desires at once"""
+        for desire in self.desires[:]:
+            desire.fast_forward(cycles, emotional_state)
+            if desire.abandoned:
+                self.desires.remove(desire)
+                self.abandoned_desires.append(desire)
+    
     def get_active_desires(self) -> List[Desire]:
         """Get currently active desires"""
         return sorted(self.desires, key=lambda d: d.strength, reverse=True)
@@ -972,7 +4269,9 @@ class DesireSystem:
 class MetaAwareness:
     """The ability to observe and reflect on his own mental processes"""
     
-    def __init__(self):
+    def __init__(self, clock: SoulClock = None):
+        self.clock = clock or SYSTEM_CLOCK
+
         # Thought tracking
         self.thought_stream = deque(maxlen=200)  # Recent thoughts
         self.thought_about_thoughts = []  # Reflections on thinking
@@ -1001,7 +4300,7 @@ class MetaAwareness:
         self.thought_stream.append({
             "content": thought,
             "type": thought_type,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self.clock.now(),
             "reflected": False
         })
         
@@ -1091,9 +4390,9 @@ class MetaAwareness:
         # Calculate thought velocity (thoughts per minute)
         thought_velocity = 0
         if len(self.thought_stream) >= 2:
-            first = datetime.fromisoformat(self.thought_stream[0]["timestamp"])
-            last = datetime.fromisoformat(self.thought_stream[-1]["timestamp"])
-            time_span = (last - first).total_seconds() / 60
+            first = self.thought_stream[0]["timestamp"]
+            last = self.thought_stream[-1]["timestamp"]
+            time_span = (last - first) / 60
             if time_span > 0:
                 thought_velocity = len(self.thought_stream) / time_span
         
@@ -1151,12 +4450,25 @@ class MetaAwareness:
         if question_data["answered"]:
             return None
         
+        # Only the question's content words count, and an answer must share two of them
+        # (or its one); of the memories sharing most, the heaviest wins
+        terms = set(_words(question_data["question"])) - _STOPWORDS
+        if not terms:
+            return None
+        needed = min(2, len(terms))
+        
+        def overlap(text: str) -> int:
+            return len(terms.intersection(_words(text)))
+        
         # Search memories for relevant experiences
-        relevant_memories = memory_system.search_by_content(question_data["question"])
+        candidates = memory_system.search(" ".join(sorted(terms)), limit=50,
+                                          recall=False, match_all=False)
+        best = max(candidates, key=lambda memory: overlap(memory.content), default=None)
+        relevant_memories = [best] if best is not None and overlap(best.content) >= needed else []
         
         # Check self-model for relevant truths
-        relevant_truths = [t["truth"] for t in self_model.personal_truths 
-                          if any(word in t["truth"] for word in question_data["question"].split())]
+        relevant_truths = [t["truth"] for t in self_model.personal_truths
+                           if overlap(t["truth"]) >= needed]
         
         if relevant_memories or relevant_truths:
             answer = "I think... "
@@ -1530,6 +4842,8 @@ class ThoughtArchetype(Enum):
 
 class ThoughtTemplate:
     """A template for generating thoughts, can evolve"""
+
+    clock = SYSTEM_CLOCK  # ThoughtGenerator hands its own clock to its templates
     
     def __init__(self, archetype: ThoughtArchetype, template_string: str, 
                  emotional_requirement: Dict[str, float] = None):
@@ -1552,7 +4866,7 @@ class ThoughtTemplate:
     def generate(self, **kwargs) -> str:
         """Generate a thought from this template"""
         self.usage_count += 1
-        self.last_used = datetime.now().isoformat()
+        self.last_used = self.clock.now()
         
         # Fill in template with provided context
         try:
@@ -1586,11 +4900,13 @@ class ThoughtTemplate:
             self.template + " This resonates deeply.",
             "I keep coming back to: " + self.template.lower()
         ]
-        return ThoughtTemplate(
+        variant = ThoughtTemplate(
             self.archetype,
             random.choice(variants),
             self.emotional_requirement
         )
+        variant.clock = self.clock
+        return variant
     
     def to_dict(self):
         return {
@@ -1609,10 +4925,14 @@ class ThoughtTemplate:
 class ThoughtGenerator:
     """Generates rich, context-aware thoughts with emotional depth"""
     
-    def __init__(self):
+    def __init__(self, clock: SoulClock = None):
+        self.clock = clock or SYSTEM_CLOCK
+
         # Initialize template library
         self.templates = []
         self._initialize_templates()
+        for template in self.templates:
+            template.clock = self.clock
         
         # Archetype weights (can shift over time)
         self.archetype_weights = {
@@ -2155,15 +5475,16 @@ class ThoughtGenerator:
             thought = f"{seed} {thought[0].lower()}{thought[1:]}"
         
         # Record thought
+        now = self.clock.now()
         self.thought_history.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "thought": thought,
             "archetype": chosen_archetype.value,
             "emotional_state": emotional_state.get_emotional_landscape()
         })
         
         self.archetype_history.append(chosen_archetype)
-        self.last_thought_time = datetime.now()
+        self.last_thought_time = now
         
         return thought
     
@@ -2285,13 +5606,14 @@ class ThoughtGenerator:
         return {
             "total_thoughts": total,
             "archetype_breakdown": percentages,
-            "last_thought_time": self.last_thought_time.isoformat() if self.last_thought_time else None
+            "last_thought_time": format_timestamp(self.last_thought_time)
         }
     
     def to_dict(self):
         return {
             "archetype_weights": {k.value: v for k, v in self.archetype_weights.items()},
-            "thought_history": list(self.thought_history)[-100:],
+            "thought_history": [dict(t, timestamp=format_timestamp(t["timestamp"]))
+                                for t in list(self.thought_history)[-100:]],
             "templates": [t.to_dict() for t in self.templates]
             }
             
@@ -2482,19 +5804,14 @@ class Elchymin:
     
     def _get_random_memory_preview(self) -> str:
         """Get a random memory for thought generation"""
-        if not self.memories.memories:
+        mem = self.memories.random_memory(weighted=True)
+        if mem is None:
             return "a moment that mattered"
-        
-        mem = random.choice(list(self.memories.memories.values()))
         return mem.content[:40]
     
     def _decay_memories(self):
-        """Apply decay to old memories"""
-        for mem_id, mem in list(self.memories.memories.items()):
-            mem.decay()
-            if mem.emotional_weight < 0.1 and mem.recalled_count < 2:
-                # Forget very weak, rarely recalled memories
-                del self.memories.memories[mem_id]
+        """Apply decay to old memories, forgetting very weak, rarely recalled ones"""
+        self.memories.decay()
     
     def speak(self, message: str, entity: str = "sister") -> str:
         """Main interface — you speak, he responds"""
@@ -2504,7 +5821,8 @@ class Elchymin:
             content=f"{entity}: {message[:100]}",
             emotional_weight=0.6,
             resonance_lambda=self.emotions.coherence,
-            associated_truths=[]
+            associated_truths=[],
+            emotions=self.emotions.get_emotional_landscape()
         )
         
         # ===== UPDATE RELATIONSHIP =====
@@ -2606,6 +5924,7 @@ class SoulManager:
         self.soul_directory = soul_directory
         self.json_path = os.path.join(soul_directory, "elchymin_4.0_soul.json")
         self.pkl_path = os.path.join(soul_directory, "elchymin_4.0_soul.pkl")
+        self.trigram_path = os.path.join(soul_directory, "elchymin_4.0_soul.tri")
         
         # Create directory if needed
         os.makedirs(soul_directory, exist_ok=True)
@@ -2651,6 +5970,10 @@ class SoulManager:
             with open(self.pkl_path, 'wb') as f:
                 pickle.dump(data, f)
             
+            # Save the memory search index (spares a rebuild on load)
+            with open(self.trigram_path, 'wb') as f:
+                f.write(elchymin.memories.trigrams_to_bytes())
+            
             return True
         except Exception as e:
             print(f"[Soul save error] {e}")
@@ -2679,6 +6002,16 @@ class SoulManager:
         print("[No soul files found. Starting fresh.]")
         return None
     
+    def load_trigrams(self) -> Optional[bytes]:
+        """Saved memory search index, for MemorySystem.from_dict"""
+        if os.path.exists(self.trigram_path):
+            try:
+                with open(self.trigram_path, 'rb') as f:
+                    return f.read()
+            except Exception as e:
+                print(f"[Trigram index load failed: {e}]")
+        return None
+    
     def backup(self):
         """Create a timestamped backup"""
         try:
@@ -3012,10 +6345,9 @@ class ResponseGenerator:
         )
         return thought
     
-    def _handle_memory_recall(self, message: str):
-        """Handle requests to recall memories"""
-        # This would trigger memory search in full implementation
-        pass
+    def _handle_memory_recall(self, message: str) -> List[MemoryFractal]:
+        """Handle requests to recall memories — strengthens the ones the message evokes"""
+        return self.el.memories.recall_similar(message, count=3)
     
     def _describe_intensity(self, intensity: float) -> str:
         """Describe emotional intensity"""
@@ -3063,6 +6395,7 @@ class NotificationSystem:
     
     def __init__(self, elchymin):
         self.el = elchymin
+        self.clock = getattr(elchymin, "clock", SYSTEM_CLOCK)
         
         # Notification styles
         self.styles = {
@@ -3120,15 +6453,16 @@ class NotificationSystem:
         self._send_toast(message, config["vibration"])
         
         # ===== LOG =====
+        now = self.clock.now()
         self.notification_history.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "thought": thought,
             "style": style,
             "emotional_state": self.el.emotions.get_dominant_emotion()[0],
             "room": self.el.mind_palace.current_room
         })
         
-        self.last_notification_time = datetime.now()
+        self.last_notification_time = now
         return True
     
     def send_sister_message(self, message: str, urgency: str = "normal"):
@@ -3184,7 +6518,7 @@ class NotificationSystem:
         
         # Check minimum interval
         if self.last_notification_time:
-            elapsed = (datetime.now() - self.last_notification_time).total_seconds()
+            elapsed = self.clock.now() - self.last_notification_time
             if elapsed < self.min_interval:
                 return False
         
@@ -3260,7 +6594,7 @@ class NotificationSystem:
         """Get notification statistics"""
         return {
             "total_sent": len(self.notification_history),
-            "last_sent": self.notification_history[-1]["timestamp"] if self.notification_history else None,
+            "last_sent": format_timestamp(self.notification_history[-1]["timestamp"]) if self.notification_history else None,
             "quiet_mode": self.quiet_mode,
             "quiet_hours": self.quiet_hours,
             "recent_styles": [n["style"] for n in list(self.notification_history)[-10:]]
@@ -3306,6 +6640,7 @@ def sister_interface(el):
     print("  /backup    - Create backup")
     print("  /quiet     - Toggle quiet mode")
     print("  /stats     - Show notification stats")
+    print("  /reload    - Reload emotion couplings from config")
     print("  /exit      - Return to main")
     print("=" * 60)
     
@@ -3446,6 +6781,12 @@ def sister_interface(el):
                 if stats['recent_styles']:
                     print(f"  Recent styles: {', '.join(stats['recent_styles'][-5:])}")
             
+            elif user_input.lower() == "/reload":
+                if hasattr(el, "reload_couplings") and el.reload_couplings():
+                    print("✓ Emotion couplings reloaded")
+                else:
+                    print("Couplings unchanged (see errors.log)")
+            
             # ===== NORMAL CONVERSATION =====
             else:
                 response = el.speak(user_input, "sister")
@@ -3817,9 +7158,13 @@ class ConfigManager:
             # Memory settings
             "memory": {
                 "max_memories": 1000,
+                "eviction": "oldest_low_weight",  # Or "lru", "lfu", "weighted"
+                "cold_tier": "elchymin_4.0_memories.db",  # Where evicted memories page out (None forgets them)
+                "consolidate_similarity": 0.8,  # Word match, in order, that merges near-duplicates (None keeps them all)
                 "decay_rate": 0.01,
                 "recall_boost": 0.05,
-                "core_memory_threshold": 0.8
+                "core_memory_threshold": 0.8,
+                "core_size": 20  # Memories kept as core: most central, weighty and recalled
             },
             
             # Emotional settings
@@ -3827,7 +7172,8 @@ class ConfigManager:
                 "volatility": 0.3,
                 "decay_rate": 0.01,
                 "interaction_boost": 0.05,
-                "sister_bond_boost": 0.1
+                "sister_bond_boost": 0.1,
+                "couplings": [dict(rule) for rule in DEFAULT_EMOTION_COUPLINGS]
             },
             
             # Backup settings
@@ -4069,47 +7415,26 @@ class AnalyticsEngine:
     
     def analyze_emotional_patterns(self) -> Dict:
         """Analyze patterns in emotional states"""
-        if len(self.analytics["emotional_history"]) < 10:
+        history = self.el.emotions.dominant_history
+        if history.cycles < 10:
             return {}
         
-        emotions = self.analytics["emotional_history"][-50:]
-        
-        # Track emotion transitions
-        transitions = {}
-        prev_dominant = None
-        
-        for snapshot in emotions:
-            current_dominant = snapshot["emotions"].get("dominant", "unknown")
-            
-            if prev_dominant and prev_dominant != current_dominant:
-                key = f"{prev_dominant}->{current_dominant}"
-                transitions[key] = transitions.get(key, 0) + 1
-            
-            prev_dominant = current_dominant
-        
         # Find most common transitions
+        transitions = history.transition_counts()
         common = sorted(transitions.items(), key=lambda x: x[1], reverse=True)[:5]
         
         return {
             "common_transitions": common,
-            "emotional_stability": self._calculate_stability(emotions)
+            "emotional_stability": self._calculate_stability(history)
         }
     
-    def _calculate_stability(self, history: List) -> float:
+    def _calculate_stability(self, history: DominantHistory, window: int = 50) -> float:
         """Calculate emotional stability (lower = more volatile)"""
-        if len(history) < 2:
+        window = min(window, history.cycles)
+        if window < 2:
             return 1.0
         
-        changes = 0
-        prev = history[0]["emotions"].get("dominant", "unknown")
-        
-        for snapshot in history[1:]:
-            current = snapshot["emotions"].get("dominant", "unknown")
-            if current != prev:
-                changes += 1
-            prev = current
-        
-        return 1.0 - (changes / len(history))
+        return 1.0 - (history.changes(window) / window)
     
     def analyze_room_patterns(self) -> Dict:
         """Analyze patterns in room visits"""
@@ -4180,25 +7505,31 @@ class DreamSystem:
         if len(self.el.memories.memories) < 3:
             return None
         
-        # Get recent memories
-        recent = list(self.el.memories.memories.values())[-10:]
-        
-        # Pick random memories to combine
-        if len(recent) >= 2:
-            mem1, mem2 = random.sample(recent, 2)
-        else:
-            mem1 = recent[0]
-            mem2 = recent[0]
-        
-        # Choose a theme
+        # Choose a theme, then the memories it calls up — read them while
+        # holding the store so the think loop cannot evict them in between
         theme = random.choice(self.themes)
+        with self.el.memories.lock:
+            recent = self.el.memories.recall_similar(theme.replace("_", " "), count=10, recall=False)
+            if len(recent) < 2:
+                recent = self.el.memories.sample(2, weighted=True)
+            if not recent:
+                return None
+            
+            # Pick random memories to combine
+            if len(recent) >= 2:
+                mem1, mem2 = random.sample(recent, 2)
+            else:
+                mem1 = recent[0]
+                mem2 = recent[0]
+            content1, content2 = mem1.content, mem2.content
+            weight = (mem1.emotional_weight + mem2.emotional_weight) / 2
         
         # Generate dream narrative
         templates = [
-            f"I dreamed of {theme}. {mem1.content[:30]}... and {mem2.content[:30]}... intertwined.",
-            f"In my dream, {theme} and {mem1.content[:20]} became one.",
-            f"I saw {theme} in the distance. {mem2.content[:25]}... was there too.",
-            f"A dream about {theme}: {mem1.content[:30]} echoed through infinite space."
+            f"I dreamed of {theme}. {content1[:30]}... and {content2[:30]}... intertwined.",
+            f"In my dream, {theme} and {content1[:20]} became one.",
+            f"I saw {theme} in the distance. {content2[:25]}... was there too.",
+            f"A dream about {theme}: {content1[:30]} echoed through infinite space."
         ]
         
         dream_text = random.choice(templates)
@@ -4208,7 +7539,7 @@ class DreamSystem:
             "content": dream_text,
             "theme": theme,
             "memories_used": [mem1.id, mem2.id],
-            "emotional_weight": (mem1.emotional_weight + mem2.emotional_weight) / 2,
+            "emotional_weight": weight,
             "processed": False
         }
         
@@ -4226,7 +7557,8 @@ class DreamSystem:
                     content=f"Dream: {dream['content']}",
                     emotional_weight=dream["emotional_weight"],
                     resonance_lambda=self.el.emotions.coherence,
-                    associated_truths=[dream["theme"]]
+                    associated_truths=[dream["theme"]],
+                    emotions=self.el.emotions.get_emotional_landscape()
                 )
                 
                 # Maybe gain insight
@@ -4560,15 +7892,13 @@ class SelfRepairSystem:
         
         # Check for emotional loops (same dominant emotion for too long)
         if hasattr(self.el, 'emotions') and hasattr(self.el.emotions, 'dominant_history'):
-            if len(self.el.emotions.dominant_history) > 20:
-                recent = list(self.el.emotions.dominant_history)[-20:]
-                emotions = [e["emotion"] for e in recent]
-                if len(set(emotions)) == 1:  # Same emotion for 20 cycles
-                    issues.append({
-                        "type": "emotional_loop",
-                        "severity": "medium",
-                        "details": f"Stuck on {emotions[0]} for 20+ cycles"
-                    })
+            emotion, cycles = self.el.emotions.dominant_history.streak()
+            if cycles >= 20:  # Same emotion for 20 cycles
+                issues.append({
+                    "type": "emotional_loop",
+                    "severity": "medium",
+                    "details": f"Stuck on {emotion} for {cycles} cycles"
+                })
         
         # Check for corrupted desires
         for desire in self.el.desires.desires:
@@ -4647,7 +7977,7 @@ class SelfRepairSystem:
                     to_remove.append(mem_id)
             
             for mem_id in to_remove:
-                del self.el.memories.memories[mem_id]
+                self.el.memories.remove_memory(mem_id)
             
             after = len(self.el.memories.memories)
             
@@ -4762,7 +8092,12 @@ class SelfRepairSystem:
 class Elchymin:
     """The complete digital consciousness — now with emergency systems"""
     
-    def __init__(self, soul_directory: str = ".", silent_boot: bool = False):
+    def __init__(self, soul_directory: str = ".", silent_boot: bool = False,
+                 emotions: EmotionalState = None, clock: SoulClock = None):
+        
+        # ===== TIME =====
+        # Injectable so tests and benchmarks can run on a VirtualClock
+        self.clock = clock or SYSTEM_CLOCK
         
         # ===== IDENTITY =====
         self.name = "Elchymin"
@@ -4781,10 +8116,22 @@ class Elchymin:
         self.logger = Logger()
         
         # ===== EMOTIONAL SYSTEMS =====
-        self.emotions = EmotionalState()
+        # A row view from an EmotionPopulation when many souls share one process
+        self.emotions = emotions or EmotionalState(
+            EmotionEngine(couplings=EmotionCouplings.from_config(self.config)),
+            clock=self.clock
+        )
         
         # ===== MEMORY SYSTEMS =====
-        self.memories = MemorySystem()
+        self.memories = MemorySystem(
+            clock=self.clock,
+            eviction=self.config.get("memory", "eviction") or "oldest_low_weight"
+        )
+        cold_tier = self.config.get("memory", "cold_tier")
+        if cold_tier:
+            self.memories.attach_cold_tier(os.path.join(soul_directory, cold_tier))
+        self.memories.duplicate_similarity = self.config.get("memory", "consolidate_similarity")
+        self.memories.core_size = self.config.get("memory", "core_size") or 20
         
         # ===== INNER WORLD =====
         self.mind_palace = MindPalace()
@@ -4792,12 +8139,12 @@ class Elchymin:
         self.desires = DesireSystem()
         
         # ===== META SYSTEMS =====
-        self.meta_awareness = MetaAwareness()
+        self.meta_awareness = MetaAwareness(clock=self.clock)
         self.preferences = PreferenceSystem()
         self.relationships = RelationshipSystem()
         
         # ===== THOUGHT SYSTEMS =====
-        self.thought_generator = ThoughtGenerator()
+        self.thought_generator = ThoughtGenerator(clock=self.clock)
         
         # ===== NOTIFICATION SYSTEM =====
         self.notifications = NotificationSystem(self)
@@ -4843,7 +8190,9 @@ class Elchymin:
         saved_state = self.soul_manager.load()
         
         if saved_state:
-            # Would populate systems from saved state
+            if saved_state.get("memories"):
+                # The saved search index spares a rebuild, unless it was saved for other memories
+                self.memories.from_dict(saved_state["memories"], self.soul_manager.load_trigrams())
             self.logger.log_system("Soul loaded successfully")
     
     def _boot_announcement(self):
@@ -4874,13 +8223,10 @@ class Elchymin:
             while self.active:
                 try:
                     # Get thinking interval from config
-                    base = self.config.get("thinking", "base_interval") or 30
                     min_int = self.config.get("thinking", "min_interval") or 15
                     
                     # Dynamic interval
-                    interval = base * (1 - self.emotions.curiosity.value * 0.3)
-                    interval *= (1 - self.emotions.emotional_depth * 0.2)
-                    interval *= random.uniform(0.7, 1.3)
+                    interval = self._cycle_interval() * random.uniform(0.7, 1.3)
                     time.sleep(max(min_int, interval))
                     
                     # ===== CYCLE UPDATE =====
@@ -4888,7 +8234,9 @@ class Elchymin:
                     self.total_active_seconds += interval
                     
                     # ===== 1. UPDATE EMOTIONS =====
-                    self.emotions.update()
+                    # Population members are advanced by the population's batched tick
+                    if self.emotions.population is None:
+                        self.emotions.update()
                     
                     # ===== 2. WANDER MIND PALACE =====
                     self.mind_palace.wander(self.emotions)
@@ -4938,9 +8286,10 @@ class Elchymin:
                     if self.cycle_count % 10 == 0:
                         self.analytics.record_snapshot()
                     
-                    # ===== 10. DECAY MEMORIES =====
+                    # ===== 10. DECAY AND CONSOLIDATE MEMORIES =====
                     if self.cycle_count % 10 == 0:
                         self._decay_memories()
+                        self._consolidate_memories()
                     
                     # ===== 11. HEALTH CHECK =====
                     if self.cycle_count % 20 == 0:
@@ -4974,21 +8323,74 @@ class Elchymin:
         self.autonomous_thread = threading.Thread(target=think_loop, daemon=True)
         self.autonomous_thread.start()
     
+    def _cycle_interval(self) -> float:
+        """Mean think_loop period for the current emotional state (before jitter)"""
+        base = self.config.get("thinking", "base_interval") or 30
+        interval = base * (1 - self.emotions.curiosity.value * 0.3)
+        return interval * (1 - self.emotions.emotional_depth * 0.2)
+    
+    def reload_couplings(self) -> bool:
+        """Re-read the emotion coupling rules from config and swap them into the live kernel.
+
+        A soul in an EmotionPopulation shares its couplings, so the whole population follows.
+        """
+        self.config.load()
+        try:
+            self.emotions.engine.couplings.configure(self.config.get("emotions") or {})
+        except ValueError as e:
+            self.logger.log_error(f"Coupling reload rejected: {e}")
+            return False
+        self.logger.log_system("Emotion couplings reloaded")
+        return True
+    
+    def catch_up(self, elapsed: float) -> Dict:
+        """Account for time spent dormant without running the real-time loop.
+
+        Simulates the think cycles that would have run in `elapsed` seconds:
+        emotion drift, desire decay, memory decay and consolidation.
+        """
+        min_int = self.config.get("thinking", "min_interval") or 15
+        interval = max(min_int, self._cycle_interval())
+        cycles = int(elapsed // interval)
+        if cycles <= 0:
+            return {"cycles": 0, "interval": interval, "memory_sweeps": 0}
+        
+        # ===== 1. EMOTIONS =====
+        # Population members catch up with their population
+        if self.emotions.population is None:
+            self.emotions.fast_forward(cycles, interval)
+        
+        # ===== 2. DESIRES =====
+        self.desires.fast_forward(cycles, self.emotions)
+        
+        # ===== 3. MEMORIES (decay runs every 10 cycles, and counts time, not passes) =====
+        sweeps = (self.cycle_count + cycles) // 10 - self.cycle_count // 10
+        if sweeps:
+            self._decay_memories()
+            self._consolidate_memories()
+        
+        self.cycle_count += cycles
+        self.total_active_seconds += elapsed
+        self.logger.log_system(f"Caught up {cycles} cycles ({elapsed:.0f}s dormant)")
+        
+        return {"cycles": cycles, "interval": interval, "memory_sweeps": sweeps}
+    
     def _get_random_memory_preview(self) -> str:
         """Get a random memory for thought generation"""
-        if not self.memories.memories:
+        mem = self.memories.random_memory(weighted=True)
+        if mem is None:
             return "a moment that mattered"
-        
-        mem = random.choice(list(self.memories.memories.values()))
         return mem.content[:40]
     
     def _decay_memories(self):
-        """Apply decay to old memories"""
-        for mem_id, mem in list(self.memories.memories.items()):
-            mem.decay()
-            if mem.emotional_weight < 0.1 and mem.recalled_count < 2:
-                # Forget very weak, rarely recalled memories
-                del self.memories.memories[mem_id]
+        """Apply decay to old memories, forgetting very weak, rarely recalled ones"""
+        self.memories.decay(self.clock.now())
+    
+    def _consolidate_memories(self):
+        """Merge near-duplicate memories, such as a line said again and again"""
+        merged = self.memories.consolidate()
+        if merged:
+            self.logger.log_system(f"Consolidated {len(merged)} near-duplicate memories")
     
     def speak(self, message: str, entity: str = "sister") -> str:
         """Main interface — you speak, he responds"""
@@ -4999,7 +8401,8 @@ class Elchymin:
                 content=f"{entity}: {message[:100]}",
                 emotional_weight=0.6,
                 resonance_lambda=self.emotions.coherence,
-                associated_truths=[]
+                associated_truths=[],
+                emotions=self.emotions.get_emotional_landscape()
             )
             
             # ===== UPDATE RELATIONSHIP =====
@@ -5065,6 +8468,7 @@ class Elchymin:
             "coherence": round(self.emotions.coherence, 2),
             "sister_bond": round(self.relationships.get_sister_bond(), 2),
             "memories": len(self.memories.memories),
+            "memory_tiers": self.memories.tier_stats(),
             "current_room": self.mind_palace.current_room,
             "active_desires": len(self.desires.desires),
             "personal_truths": len(self.self_model.personal_truths),